@@ -673,16 +673,38 @@ class AeroBuildup(ExplicitAnalysis):
                 mach=mach_normal,
             )
 
-            xsec_a_Cl = airfoil_a.CL_function(**xsec_a_args)
-            xsec_b_Cl = airfoil_b.CL_function(**xsec_b_args)
+            batch_polar_queries = (  # If both cross-sections share one Airfoil object and the queries are scalar,
+                    airfoil_a is airfoil_b and  # each pair of polar lookups can be made as one batched call;
+                    np.length(alpha_generalized_effective) == 1 and  # only the Reynolds number differs between them.
+                    np.length(Re_a) == 1 and
+                    np.length(Re_b) == 1 and
+                    np.length(mach_normal) == 1
+            )
+            if batch_polar_queries:
+                xsec_ab_args = dict(
+                    alpha=alpha_generalized_effective * np.ones(2),
+                    Re=np.stack([Re_a, Re_b]),
+                    mach=mach_normal * np.ones(2),
+                )
+                xsec_ab_Cl = airfoil_a.CL_function(**xsec_ab_args)
+                xsec_a_Cl = xsec_ab_Cl[0]
+                xsec_b_Cl = xsec_ab_Cl[1]
+            else:
+                xsec_a_Cl = airfoil_a.CL_function(**xsec_a_args)
+                xsec_b_Cl = airfoil_b.CL_function(**xsec_b_args)
             sect_CL = (
                               xsec_a_Cl * a_weight +
                               xsec_b_Cl * b_weight
                       ) * AR_3D_factor ** 0.2  # Models slight decrease in finite-wing CL_max.
 
             ##### Compute sectional drag at cross-sections using lookup functions. Merge them linearly to get section CD.
-            xsec_a_Cdp = airfoil_a.CD_function(**xsec_a_args)
-            xsec_b_Cdp = airfoil_b.CD_function(**xsec_b_args)
+            if batch_polar_queries:
+                xsec_ab_Cdp = airfoil_a.CD_function(**xsec_ab_args)
+                xsec_a_Cdp = xsec_ab_Cdp[0]
+                xsec_b_Cdp = xsec_ab_Cdp[1]
+            else:
+                xsec_a_Cdp = airfoil_a.CD_function(**xsec_a_args)
+                xsec_b_Cdp = airfoil_b.CD_function(**xsec_b_args)
             sect_CDp = (
                     (
                             xsec_a_Cdp * a_weight +
@@ -691,8 +713,13 @@ class AeroBuildup(ExplicitAnalysis):
             )
 
             ##### Compute sectional moment at cross-sections using lookup functions. Merge them linearly to get section CM.
-            xsec_a_Cm = airfoil_a.CM_function(**xsec_a_args)
-            xsec_b_Cm = airfoil_b.CM_function(**xsec_b_args)
+            if batch_polar_queries:
+                xsec_ab_Cm = airfoil_a.CM_function(**xsec_ab_args)
+                xsec_a_Cm = xsec_ab_Cm[0]
+                xsec_b_Cm = xsec_ab_Cm[1]
+            else:
+                xsec_a_Cm = airfoil_a.CM_function(**xsec_a_args)
+                xsec_b_Cm = airfoil_b.CM_function(**xsec_b_args)
             sect_CM = (
                     xsec_a_Cm * a_weight +
                     xsec_b_Cm * b_weight
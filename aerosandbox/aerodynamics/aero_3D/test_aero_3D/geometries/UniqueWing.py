@@ -1,10 +1,10 @@
 import aerosandbox as asb
+from pathlib import Path
 
-sd7037 = asb.Airfoil("sd7037")
+cache_directory = Path(__file__).parent / "cache"
 
-sd7037.generate_polars(cache_filename="./cache/sd7037")
+sd7037 = asb.Airfoil("sd7037")
 naca0012 = asb.Airfoil("naca0012")
-naca0012.generate_polars(cache_filename="./cache/naca0012.json")
 
 airplane = asb.Airplane(
     name="Vanilla",
@@ -54,4 +54,7 @@ airplane = asb.Airplane(
 )
 
 if __name__ == '__main__':
+    airplane.generate_polars(cache_dir=cache_directory)
+    sd7037.generate_polars(cache_filename=cache_directory / "sd7037.json")  # Not on the airplane, so not covered above.
+
     airplane.draw_three_view()
@@ -1,10 +1,13 @@
 import aerosandbox as asb
 import aerosandbox.numpy as np
+from pathlib import Path
+
+cache_directory = Path(__file__).parent / "cache"
 
 wing_airfoil = asb.Airfoil("sd7037")
 tail_airfoil = asb.Airfoil("naca0010")
-wing_airfoil.generate_polars(cache_filename="cache/sd7037")
-tail_airfoil.generate_polars(cache_filename="cache/naca0010")
+wing_airfoil.generate_polars(cache_filename=cache_directory / "sd7037.json")
+tail_airfoil.generate_polars(cache_filename=cache_directory / "naca0010.json")
 
 ### Define the 3D geometry you want to analyze/optimize.
 # Here, all distances are in meters and all angles are in degrees.
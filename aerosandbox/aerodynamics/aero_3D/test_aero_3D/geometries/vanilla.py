@@ -1,7 +1,11 @@
 import aerosandbox as asb
 import aerosandbox.numpy as np
+from pathlib import Path
 
-sd7037 = asb.Airfoil("sd7037").generate_polars(cache_filename="cache/sd7037")
+cache_directory = Path(__file__).parent / "cache"
+
+sd7037 = asb.Airfoil("sd7037")
+sd7037.generate_polars(cache_filename=cache_directory / "sd7037.json")
 
 airplane = asb.Airplane(
     name="Vanilla",
@@ -0,0 +1,47 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+from aerosandbox.aerodynamics.aero_3D.test_aero_3D.geometries.vanilla import airplane
+
+
+@pytest.mark.parametrize(
+    "xyz_ref",
+    [
+        [0., 0., 0.],
+        [0.5, 0.5, 0.],  # Off the symmetry plane, to exercise the mirrored-moment bookkeeping.
+    ]
+)
+def test_symmetric_solve_matches_full_solve(xyz_ref):
+    """
+    The symmetric solve (run_symmetric_if_possible=True) only computes the y >= 0 half of the problem and
+    reconstructs the other half by mirroring; on a symmetric airplane it should agree with the full solve
+    to numerical precision. The vanilla airplane includes a centerline vertical surface, so that case is
+    covered too.
+    """
+    op_point = asb.OperatingPoint(
+        velocity=10,
+        alpha=5,
+    )
+
+    full = asb.VortexLatticeMethod(
+        airplane=airplane,
+        op_point=op_point,
+        xyz_ref=xyz_ref,
+    ).run()
+
+    vlm_symmetric = asb.VortexLatticeMethod(
+        airplane=airplane,
+        op_point=op_point,
+        xyz_ref=xyz_ref,
+        run_symmetric_if_possible=True,
+    )
+    assert vlm_symmetric.run_symmetric  # The vanilla airplane should qualify for the symmetric solve.
+    symmetric = vlm_symmetric.run()
+
+    for key in ["CL", "CD", "Cl", "Cm", "Cn"]:
+        assert symmetric[key] == pytest.approx(full[key], abs=1e-10)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -73,16 +73,15 @@ class VortexLatticeMethod(ExplicitAnalysis):
         ### Determine whether you should run the problem as symmetric
         self.run_symmetric = False
         if run_symmetric_if_possible:
-            raise NotImplementedError("VLM with symmetry detection not yet implemented!")
-            # try:
-            #     self.run_symmetric = (  # Satisfies assumptions
-            #             self.op_point.beta == 0 and
-            #             self.op_point.p == 0 and
-            #             self.op_point.r == 0 and
-            #             self.airplane.is_entirely_symmetric()
-            #     )
-            # except RuntimeError:  # Required because beta, p, r, etc. may be non-numeric (e.g. opti variables)
-            #     pass
+            try:
+                self.run_symmetric = (  # Satisfies assumptions
+                        self.op_point.beta == 0 and
+                        self.op_point.p == 0 and
+                        self.op_point.r == 0 and
+                        self.airplane.is_entirely_symmetric()
+                )
+            except RuntimeError:  # Required because beta, p, r, etc. may be non-numeric (e.g. opti variables)
+                pass
 
     def __repr__(self):
         return self.__class__.__name__ + "(\n\t" + "\n\t".join([
@@ -175,12 +174,38 @@ class VortexLatticeMethod(ExplicitAnalysis):
                 0.5 * (0.25 * front_right_vertices + 0.75 * back_right_vertices)
         )
 
+        ##### Exploit symmetry, if possible
+        if self.run_symmetric:
+            # For an XZ-symmetric problem, the vortex strength distribution is itself XZ-symmetric, so only the
+            # panels on (or right of) the symmetry plane need to be solved for. The influence of each dropped
+            # left-side panel is recovered by mirroring its starboard twin's horseshoe across the XZ plane.
+            keep = vortex_centers[:, 1] > -1e-8
+            use_symmetry = vortex_centers[keep, 1] > 1e-8
+            # Panels directly on the centerline (e.g., vertical stabilizers) are their own mirror image,
+            # so they get no mirrored contribution.
+
+            front_left_vertices = front_left_vertices[keep, :]
+            back_left_vertices = back_left_vertices[keep, :]
+            back_right_vertices = back_right_vertices[keep, :]
+            front_right_vertices = front_right_vertices[keep, :]
+            is_trailing_edge = is_trailing_edge[keep]
+            normal_directions = normal_directions[keep, :]
+            areas = areas[keep]
+            left_vortex_vertices = left_vortex_vertices[keep, :]
+            right_vortex_vertices = right_vortex_vertices[keep, :]
+            vortex_centers = vortex_centers[keep, :]
+            vortex_bound_leg = vortex_bound_leg[keep, :]
+            collocation_points = collocation_points[keep, :]
+        else:
+            use_symmetry = None
+
         ### Save things to the instance for later access
         self.front_left_vertices = front_left_vertices
         self.back_left_vertices = back_left_vertices
         self.back_right_vertices = back_right_vertices
         self.front_right_vertices = front_right_vertices
         self.is_trailing_edge = is_trailing_edge
+        self.use_symmetry = use_symmetry
         self.normal_directions = normal_directions
         self.areas = areas
         self.left_vortex_vertices = left_vortex_vertices
@@ -240,6 +265,32 @@ class VortexLatticeMethod(ExplicitAnalysis):
                 w_collocations_unit * tall(normal_directions[:, 2])
         )
 
+        if self.run_symmetric:  # If it's a symmetric problem, you've got to add the other side's influence.
+            u_mirror, v_mirror, w_mirror = calculate_induced_velocity_horseshoe(
+                x_field=tall(collocation_points[:, 0]),
+                y_field=tall(collocation_points[:, 1]),
+                z_field=tall(collocation_points[:, 2]),
+                x_left=wide(right_vortex_vertices[:, 0]),  # Note: the mirrored horseshoe has its left and right
+                y_left=wide(-right_vortex_vertices[:, 1]),  # vertices swapped, which keeps the circulation sense
+                z_left=wide(right_vortex_vertices[:, 2]),  # consistent with the starboard vortex it mirrors.
+                x_right=wide(left_vortex_vertices[:, 0]),
+                y_right=wide(-left_vortex_vertices[:, 1]),
+                z_right=wide(left_vortex_vertices[:, 2]),
+                trailing_vortex_direction=(
+                    steady_freestream_direction * np.array([1, -1, 1])
+                    if self.align_trailing_vortices_with_wind else
+                    np.array([1, 0, 0])
+                ),
+                gamma=1.,
+                vortex_core_radius=self.vortex_core_radius
+            )
+
+            AIC = AIC + wide(np.where(use_symmetry, 1., 0.)) * (
+                    u_mirror * tall(normal_directions[:, 0]) +
+                    v_mirror * tall(normal_directions[:, 1]) +
+                    w_mirror * tall(normal_directions[:, 2])
+            )
+
         ##### Calculate Vortex Strengths
         if self.verbose:
             print("Calculating vortex strengths...")
@@ -271,6 +322,19 @@ class VortexLatticeMethod(ExplicitAnalysis):
         force_geometry = np.sum(forces_geometry, axis=0)
         moment_geometry = np.sum(moments_geometry, axis=0)
 
+        if self.run_symmetric:  # Add in the forces and moments from the mirrored panels.
+            mirrored = tall(np.where(self.use_symmetry, 1., 0.))
+            forces_geometry_mirrored = mirrored * forces_geometry * wide(np.array([1, -1, 1]))
+            # The mirrored moments are taken about the actual reference point, by mirroring the panel
+            # centers too - flipping the sign of the original moments would only be valid if xyz_ref
+            # lay on the symmetry plane.
+            moments_geometry_mirrored = np.cross(
+                np.add(vortex_centers * wide(np.array([1, -1, 1])), -wide(np.array(self.xyz_ref))),
+                forces_geometry_mirrored
+            )
+            force_geometry = force_geometry + np.sum(forces_geometry_mirrored, axis=0)
+            moment_geometry = moment_geometry + np.sum(moments_geometry_mirrored, axis=0)
+
         force_body = self.op_point.convert_axes(
             force_geometry[0], force_geometry[1], force_geometry[2],
             from_axes="geometry",
@@ -619,6 +683,29 @@ class VortexLatticeMethod(ExplicitAnalysis):
         v_induced = np.sum(v_induced, axis=1)
         w_induced = np.sum(w_induced, axis=1)
 
+        if self.run_symmetric:  # If it's a symmetric problem, you've got to add the other side's influence.
+            u_mirror, v_mirror, w_mirror = calculate_induced_velocity_horseshoe(
+                x_field=tall(points[:, 0]),
+                y_field=tall(points[:, 1]),
+                z_field=tall(points[:, 2]),
+                x_left=wide(self.right_vortex_vertices[:, 0]),
+                y_left=wide(-self.right_vortex_vertices[:, 1]),
+                z_left=wide(self.right_vortex_vertices[:, 2]),
+                x_right=wide(self.left_vortex_vertices[:, 0]),
+                y_right=wide(-self.left_vortex_vertices[:, 1]),
+                z_right=wide(self.left_vortex_vertices[:, 2]),
+                trailing_vortex_direction=(
+                    self.steady_freestream_direction * np.array([1, -1, 1])
+                    if self.align_trailing_vortices_with_wind else
+                    np.array([1, 0, 0])
+                ),
+                gamma=wide(np.where(self.use_symmetry, self.vortex_strengths, 0.)),
+                vortex_core_radius=self.vortex_core_radius
+            )
+            u_induced = u_induced + np.sum(u_mirror, axis=1)
+            v_induced = v_induced + np.sum(v_mirror, axis=1)
+            w_induced = w_induced + np.sum(w_mirror, axis=1)
+
         V_induced = np.stack([
             u_induced, v_induced, w_induced
         ], axis=1)
@@ -6,12 +6,83 @@ from aerosandbox.geometry.airfoil.airfoil_families import get_NACA_coordinates,
 from aerosandbox.geometry.airfoil.default_airfoil_aerodynamics import default_CL_function, default_CD_function, \
     default_CM_function
 from aerosandbox.library.aerodynamics import transonic
-from aerosandbox.modeling.splines.hermite import linear_hermite_patch, cubic_hermite_patch
-from scipy import interpolate
-from typing import Callable, Union, Any, Dict, List
+from aerosandbox.modeling.splines.hermite import cubic_hermite_patch
+from typing import Callable, Union, Any, Dict, List, Tuple
+from functools import lru_cache
+import io
 import json
+import math
 from pathlib import Path
 import os
+import re
+
+_naca_4_series_pattern = re.compile(r"naca\d{4}", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _get_UIUC_database_names() -> frozenset:
+    """
+    Returns the set of (lowercase, extensionless) airfoil names available in the bundled UIUC airfoil database,
+    listed once and cached. Lets name lookups test membership instead of attempting a file open and catching the
+    failure.
+    """
+    from aerosandbox.geometry.airfoil import airfoil_database
+
+    return frozenset(
+        file.stem.lower()
+        for file in Path(airfoil_database.__file__).parent.iterdir()
+        if file.suffix in {"", ".dat"} and not file.name.startswith("__")
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_coordinates_from_name(name: str) -> Union[np.ndarray, None]:
+    """
+    Attempts to get the coordinates of an airfoil from its name, first by treating the name as a 4-digit NACA
+    airfoil, and then by looking it up in the UIUC airfoil database. Returns None if neither works.
+
+    Both checks are cheap predicates (a regex match and a set lookup) rather than attempt-and-catch, so
+    unrecognized names don't pay for exception unwinding. Results are cached, so that repeatedly constructing
+    Airfoils with the same name (a common pattern when defining multi-section wings) only pays the
+    coordinate-generation or file-parsing cost once.
+
+    The returned arrays are shared by every Airfoil constructed with the same name, so they are marked
+    read-only; modify an airfoil by reassigning `.coordinates` (as the transform methods do), not by
+    writing into the array in place.
+    """
+    normalized_name = name.lower().strip()
+
+    if _naca_4_series_pattern.fullmatch(normalized_name):  # See if it's a NACA airfoil
+        coordinates = get_NACA_coordinates(name=normalized_name)
+    elif normalized_name in _get_UIUC_database_names():  # See if it's in the UIUC airfoil database
+        try:
+            coordinates = get_UIUC_coordinates(name=normalized_name)
+        except Exception:  # e.g., a present-but-unparseable database file; treat as not found, as before.
+            return None
+    else:
+        return None
+
+    coordinates.flags.writeable = False
+    return coordinates
+
+
+_polar_cache_file_reads: Dict[tuple, Dict[str, np.ndarray]] = {}
+"""
+Module-level cache of parsed polar cache files, keyed on (absolute path, modification time).
+
+Many Airfoil instances typically point at the same polar cache file (e.g., every naca0012 in a design study); caching
+the parsed arrays here means each file is read and parsed once per process, and all instances share one copy of the
+data in memory. The arrays are marked read-only, since they are shared. A changed modification time (e.g., the cache
+was regenerated) naturally invalidates the entry.
+"""
+
+_default_x_over_c_sample = np.linspace(0, 1, 101)
+"""
+The default chordwise sample used by local_camber(), local_thickness(), and the max_* methods. A single shared
+array (rather than a fresh np.linspace() per call site) lets the identity-keyed surface-interpolation memo
+recognize back-to-back default-sample queries as identical.
+"""
+_default_x_over_c_sample.flags.writeable = False  # Shared across all Airfoils, so freeze it.
 
 
 class Airfoil(Polygon):
@@ -97,28 +168,19 @@ class Airfoil(Polygon):
         ### Handle the coordinates
         self.coordinates = None
         if coordinates is None:  # If no coordinates are given
-            try:  # See if it's a NACA airfoil
-                self.coordinates = get_NACA_coordinates(name=self.name)
-            except Exception:
-                try:  # See if it's in the UIUC airfoil database
-                    self.coordinates = get_UIUC_coordinates(name=self.name)
-                except Exception:
-                    pass
-        else:
-
-            try:  # If coordinates is a string, assume it's a filepath to a .dat file
+            self.coordinates = _get_coordinates_from_name(self.name)
+        elif isinstance(coordinates, (str, os.PathLike)):  # If coordinates is a string, it's a filepath to a .dat file
+            try:
                 self.coordinates = get_file_coordinates(filepath=coordinates)
-            except (OSError, FileNotFoundError, TypeError, UnicodeDecodeError):
-                try:
-                    shape = coordinates.shape
-                    assert len(shape) == 2
-                    assert shape[0] == 2 or shape[1] == 2
-                    if not shape[1] == 2:
-                        coordinates = np.transpose(shape)
+            except (OSError, FileNotFoundError, UnicodeDecodeError):
+                pass
+        elif hasattr(coordinates, "shape"):  # Otherwise, assume it's an array of the coordinates themselves
+            shape = coordinates.shape
+            if len(shape) == 2 and (shape[0] == 2 or shape[1] == 2):
+                if not shape[1] == 2:
+                    coordinates = np.transpose(coordinates)
 
-                    self.coordinates = coordinates
-                except AttributeError:
-                    pass
+                self.coordinates = coordinates  # Canonicalized to contiguous float64 by the property setter.
 
         if self.coordinates is None:
             import warnings
@@ -145,6 +207,23 @@ class Airfoil(Polygon):
         if CM_function is not None:
             self.CM_function = CM_function
 
+    @property
+    def coordinates(self) -> np.ndarray:
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, value):
+        """
+        Canonicalizes numeric coordinate arrays to contiguous float64 on assignment, so that downstream
+        vectorized ops (matmuls, diffs, surface splits) always see unit-stride memory - including after
+        direct reassignments like `af.coordinates = af.coordinates[::5, :]`, which would otherwise leave a
+        strided view. Already-canonical arrays pass through without a copy (preserving the identity-keyed
+        geometry caches), as do None and symbolic CasADi matrices.
+        """
+        if value is not None and hasattr(value, "shape") and not np.is_casadi_type(value, recursive=False):
+            value = np.ascontiguousarray(value, dtype=float)
+        self._coordinates = value
+
     def __repr__(self) -> str:
         return f"Airfoil {self.name} ({self.n_points()} points)"
 
@@ -165,15 +244,44 @@ class Airfoil(Polygon):
         if not type(self) == type(other):  # If the types are different, they're not equal
             return False
 
-        # At this point, we know that the types are the same, so we can compare the attributes
-        return all([  # If all of these are true, they're equal
-            self.name == other.name,
-            np.allclose(self.coordinates, other.coordinates) if
-            self.coordinates.shape[0] == other.coordinates.shape[0] else False,
-            self.CL_function is other.CL_function,
-            self.CD_function is other.CD_function,
-            self.CM_function is other.CM_function,
-        ])
+        # At this point, we know that the types are the same, so we can compare the attributes.
+        # Cheap scalar and identity comparisons go first; the full coordinate arrays are only compared if
+        # everything else already matches.
+        if not (
+                self.name == other.name and
+                self.CL_function is other.CL_function and
+                self.CD_function is other.CD_function and
+                self.CM_function is other.CM_function and
+                self.coordinates.shape[0] == other.coordinates.shape[0]
+        ):
+            return False
+
+        if self.coordinates is other.coordinates:
+            return True
+        if self._coordinates_hash() == other._coordinates_hash():
+            return np.array_equal(self.coordinates, other.coordinates)
+        return np.allclose(self.coordinates, other.coordinates)
+
+    def _coordinates_hash(self) -> int:
+        """
+        A cheap-to-compare fingerprint of the exact coordinate bytes, cached on the instance. Used to
+        accelerate __eq__ and to make Airfoils hashable.
+        """
+        return self._cached_geometry_value(
+            "coordinates_hash",
+            lambda: hash(self.coordinates.tobytes()) if self.coordinates is not None else 0
+        )
+
+    def __hash__(self) -> int:
+        """
+        Hashes on the name only, so Airfoils can be used as dict keys / set members.
+
+        __eq__ requires name equality before it ever compares coordinates (and compares those with a
+        floating-point tolerance), so the name is the finest invariant of equality that can be hashed:
+        folding any coordinate-derived value in would let tolerance-equal airfoils hash differently,
+        breaking the __eq__/__hash__ contract.
+        """
+        return hash(self.name)
 
     def has_polars(self) -> bool:
         return (
@@ -191,6 +299,7 @@ class Airfoil(Polygon):
                         include_compressibility_effects: bool = True,
                         transonic_buffet_lift_knockdown: float = 0.3,
                         make_symmetric_polars: bool = False,
+                        solver: str = "xfoil",
                         ) -> None:
         """
         Generates airfoil polar surrogate models (CL, CD, CM functions) from XFoil data and assigns them in-place to
@@ -212,13 +321,17 @@ class Airfoil(Polygon):
 
             Res: The range of Reynolds numbers to sample from XFoil at. Dimensionless.
 
-            cache_filename: A path-like filename (ideally a "*.json" file) that can be used to cache the XFoil
-                results, making it much faster to regenerate the results.
+            cache_filename: A path-like filename (either a "*.json" or "*.npz" file; the extension determines the
+                serialization format) that can be used to cache the XFoil results, making it much faster to
+                regenerate the results.
 
                 * If the file does not exist, XFoil will be run, and a cache file will be created.
 
                 * If the file does exist, XFoil will not be run, and the cache file will be read instead.
 
+                The "*.npz" binary format (written compressed) is both smaller on disk and much faster to read
+                back than JSON, and is recommended for new caches; "*.json" remains supported for existing ones.
+
             xfoil_kwargs: Keyword arguments to pass into the AeroSandbox XFoil module. See the aerosandbox.XFoil
                 constructor for options.
 
@@ -230,12 +343,26 @@ class Airfoil(Polygon):
                 mach tuck, CL effects across normal shocks. Note that accuracy here is dubious in the transonic regime
                 and above - you should really specify your own CL/CD/CM models
 
+            solver: Which 2D analysis tool should generate the low-speed data underlying the polars? Options:
+
+                * "xfoil" (default): Runs an XFoil alpha sweep at each Reynolds number. Requires an XFoil
+                    executable to be available; see the aerosandbox.XFoil constructor.
+
+                * "neuralfoil": Evaluates the NeuralFoil surrogate model on the whole (alpha, Re) grid in one
+                    batched call - orders of magnitude faster than XFoil and with no convergence failures, at some
+                    cost in fidelity near stall. Requires the optional `neuralfoil` package.
+
         Returns: None (in-place), adds the following functions to the instance:
 
             * Airfoil.CL_function(alpha, Re, mach)
             * Airfoil.CD_function(alpha, Re, mach)
             * Airfoil.CM_function(alpha, Re, mach)
 
+        Note: the generated polar functions memoize intermediate results across back-to-back CL/CD/CM queries
+        at the same inputs. Small numeric inputs are validated by value, but symbolic (CasADi) inputs and very
+        large arrays are only validated by object identity - so if you mutate such an input array in-place and
+        re-query with the same object, pass a fresh array instead to avoid a stale cache hit.
+
         """
         if self.coordinates is None:
             raise ValueError("Cannot generate polars for an airfoil that you don't have the coordinates of!")
@@ -268,47 +395,104 @@ class Airfoil(Polygon):
         ### Retrieve XFoil Polar Data from the cache, if it exists.
         data = None
         if cache_filename is not None:
+            cache_uses_npz = str(cache_filename).endswith(".npz")
             try:
-                with open(cache_filename, "r") as f:
-                    data = {
-                        k: np.array(v)
-                        for k, v in json.load(f).items()
-                    }
+                cache_file_key = (
+                    os.path.abspath(cache_filename),
+                    os.path.getmtime(cache_filename),
+                )
             except FileNotFoundError:
-                pass
-
-        ### Analyze airfoil with XFoil, if needed
+                cache_file_key = None
+
+            if cache_file_key is not None:
+                try:  # See if this exact file has already been parsed by another Airfoil in this process.
+                    data = _polar_cache_file_reads[cache_file_key]
+                except KeyError:
+                    if cache_uses_npz:
+                        with np.load(cache_filename) as f:
+                            data = {k: f[k] for k in f.files}
+                    else:
+                        with open(cache_filename, "r") as f:
+                            data = {
+                                k: np.array(v)
+                                for k, v in json.load(f).items()
+                            }
+                    for v in data.values():  # The parsed arrays are shared across instances, so freeze them.
+                        v.flags.writeable = False
+                    _polar_cache_file_reads[cache_file_key] = data
+
+        ### Analyze airfoil with the requested solver, if needed
         if data is None:
             ### If a cache filename is given, ensure that the directory exists.
             if cache_filename is not None:
                 os.makedirs(os.path.dirname(cache_filename), exist_ok=True)
 
-            from aerosandbox.aerodynamics.aero_2D import XFoil
+            if solver == "xfoil":
+                from aerosandbox.aerodynamics.aero_2D import XFoil
+
+                def get_run_data(Re):  # Get the data for an XFoil alpha sweep at one specific Re.
+                    run_data = XFoil(
+                        airfoil=self,
+                        Re=Re,
+                        **xfoil_kwargs
+                    ).alpha(alphas)
+                    run_data["Re"] = Re * np.ones_like(run_data["alpha"])
+                    return run_data  # Data is a dict where keys are figures of merit [str] and values are 1D ndarrays.
+
+                from concurrent.futures import ThreadPoolExecutor
+                from tqdm import tqdm
+
+                # The Reynolds sweep is embarrassingly parallel: each run spawns its own XFoil subprocess in its own
+                # temporary directory, so nothing is shared. Threads (not processes) are the right tool here, since the
+                # Python side just babysits subprocess I/O. The exception is when the user pins a `working_directory`:
+                # all runs would then read/write the same files, so they must run one at a time.
+                if xfoil_kwargs.get("working_directory") is not None:
+                    max_workers = 1
+                else:
+                    max_workers = min(len(Res), os.cpu_count() or 1)
+
+                with ThreadPoolExecutor(
+                        max_workers=max_workers
+                ) as executor:
+                    run_datas = list(tqdm(  # A list of dicts, each the result of an XFoil run at a particular Re.
+                        executor.map(get_run_data, Res),
+                        total=len(Res),
+                        desc=f"Running XFoil to generate polars for Airfoil '{self.name}':",
+                    ))
+                data = {  # Merge the dicts into one big database of all runs.
+                    k: np.concatenate(
+                        [run_data[k] for run_data in run_datas]
+                    )
+                    for k in run_datas[0].keys()
+                }
 
-            def get_run_data(Re):  # Get the data for an XFoil alpha sweep at one specific Re.
-                run_data = XFoil(
+            elif solver == "neuralfoil":
+                try:
+                    import neuralfoil as nf
+                except ImportError as e:
+                    raise ImportError(
+                        "The \"neuralfoil\" solver requires the `neuralfoil` package, which is not installed.\n"
+                        "Install it with `pip install neuralfoil`, or use the default solver=\"xfoil\"."
+                    ) from e
+
+                # The whole (alpha, Re) grid goes through the surrogate as one batched forward pass -
+                # no per-point Newton solves, no subprocesses.
+                alpha_grid, Re_grid = np.meshgrid(alphas, Res)
+                aero = nf.get_aero_from_airfoil(
                     airfoil=self,
-                    Re=Re,
-                    **xfoil_kwargs
-                ).alpha(alphas)
-                run_data["Re"] = Re * np.ones_like(run_data["alpha"])
-                return run_data  # Data is a dict where keys are figures of merit [str] and values are 1D ndarrays.
-
-            from tqdm import tqdm
-
-            run_datas = [  # Get a list of dicts, where each dict is the result of an XFoil run at a particular Re.
-                get_run_data(Re)
-                for Re in tqdm(
-                    Res,
-                    desc=f"Running XFoil to generate polars for Airfoil '{self.name}':",
+                    alpha=alpha_grid.reshape(-1),
+                    Re=Re_grid.reshape(-1),
                 )
-            ]
-            data = {  # Merge the dicts into one big database of all runs.
-                k: np.concatenate(
-                    tuple([run_data[k] for run_data in run_datas])
-                )
-                for k in run_datas[0].keys()
-            }
+                data = {
+                    "alpha": alpha_grid.reshape(-1),
+                    "Re"   : Re_grid.reshape(-1),
+                    "CL"   : aero["CL"],
+                    "CD"   : aero["CD"],
+                    "CM"   : aero["CM"],
+                }
+
+            else:
+                raise ValueError("Bad value of `solver`! Valid options are \"xfoil\" and \"neuralfoil\".")
 
             if make_symmetric_polars:  # If the airfoil is known to be symmetric, duplicate all data across alpha.
                 keys_symmetric_across_alpha = ['CD', 'CDp', 'Re']  # Assumes the rest are antisymmetric
@@ -319,18 +503,33 @@ class Airfoil(Polygon):
                 }
 
             if cache_filename is not None:  # Cache the accumulated data for later use, if it doesn't already exist.
-                with open(cache_filename, "w+") as f:
-                    json.dump(
-                        {k: v.tolist() for k, v in data.items()},
-                        f,
-                        indent=4
-                    )
+                # Write to a temporary file first, then atomically rename it into place. This way, a crashed or
+                # interrupted run can never leave a half-written cache file behind for the next run to trip over.
+                cache_filename_temp = f"{cache_filename}.tmp"
+                if cache_uses_npz:
+                    with open(cache_filename_temp, "wb") as f:
+                        np.savez_compressed(f, **data)
+                else:
+                    with open(cache_filename_temp, "w+") as f:
+                        json.dump(
+                            {k: v.tolist() for k, v in data.items()},
+                            f,
+                            indent=4
+                        )
+                os.replace(cache_filename_temp, cache_filename)
+                for v in data.values():  # Frozen, same as the read path: these arrays are shared across instances.
+                    v.flags.writeable = False
+                _polar_cache_file_reads[(
+                    os.path.abspath(cache_filename),
+                    os.path.getmtime(cache_filename),
+                )] = data  # Make the freshly-written data available to other Airfoils without a re-read.
 
         ### Save the raw data as an instance attribute for later use
         self.xfoil_data = data
 
         ### Make the interpolators for attached aerodynamics
         from aerosandbox.modeling import UnstructuredInterpolatedModel
+        from scipy import interpolate
 
         attached_alphas_to_use = (
             alphas[::2] if len(alphas) > 20 else alphas
@@ -356,24 +555,57 @@ class Airfoil(Polygon):
             "ln_Re": np.log(Re_resample)
         }
 
-        CL_attached_interpolator = UnstructuredInterpolatedModel(
-            x_data=x_data,
-            y_data=data["CL"],
-            x_data_resample=x_data_resample,
-            **unstructured_interpolated_model_kwargs
-        )
-        log10_CD_attached_interpolator = UnstructuredInterpolatedModel(
-            x_data=x_data,
-            y_data=np.log10(data["CD"]),
-            x_data_resample=x_data_resample,
-            **unstructured_interpolated_model_kwargs
-        )
-        CM_attached_interpolator = UnstructuredInterpolatedModel(
-            x_data=x_data,
-            y_data=data["CM"],
-            x_data_resample=x_data_resample,
-            **unstructured_interpolated_model_kwargs
-        )
+        # Note on cost: the RBF here is only used once, at construction time, to resample the unstructured XFoil
+        # data onto the structured (alpha, ln_Re) grid - queries go through the fast tensor-product spline of the
+        # underlying InterpolatedModel. When the resampling setup is the default (the usual case), the three
+        # attached-flow surrogates share a single vector-valued RBF solve, since their linear systems differ only
+        # in the right-hand side; a user-customized setup falls back to three independent constructions.
+        y_datas = {
+            "CL"   : data["CL"],
+            "ln_CD": np.log(data["CD"]),
+            "CM"   : data["CM"],
+        }
+
+        if set(unstructured_interpolated_model_kwargs.keys()) == {"resampling_interpolator_kwargs"}:
+            from aerosandbox.modeling import InterpolatedModel
+
+            resampling_interpolator = interpolate.RBFInterpolator(
+                y=np.stack(tuple(x_data.values()), axis=1),
+                d=np.stack(tuple(y_datas.values()), axis=1),
+                **unstructured_interpolated_model_kwargs["resampling_interpolator_kwargs"]
+            )
+            x_resample_structured = [
+                xi.flatten()
+                for xi in np.meshgrid(*x_data_resample.values(), indexing="ij")
+            ]
+            y_resample_structured = resampling_interpolator(
+                np.stack(tuple(x_resample_structured), axis=1)
+            )
+
+            attached_interpolators = {
+                k: InterpolatedModel(
+                    x_data_coordinates=x_data_resample,
+                    y_data_structured=y_resample_structured[:, i].reshape([
+                        np.length(xi)
+                        for xi in x_data_resample.values()
+                    ]),
+                )
+                for i, k in enumerate(y_datas.keys())
+            }
+        else:
+            attached_interpolators = {
+                k: UnstructuredInterpolatedModel(
+                    x_data=x_data,
+                    y_data=y_data,
+                    x_data_resample=x_data_resample,
+                    **unstructured_interpolated_model_kwargs
+                )
+                for k, y_data in y_datas.items()
+            }
+
+        CL_attached_interpolator = attached_interpolators["CL"]
+        ln_CD_attached_interpolator = attached_interpolators["ln_CD"]
+        CM_attached_interpolator = attached_interpolators["CM"]
 
         ### Determine if separated
         alpha_stall_positive = np.max(data["alpha"])  # Across all Re
@@ -406,193 +638,296 @@ class Airfoil(Polygon):
             x_data=alpha_resample,
             y_data=CL_if_separated
         )
-        log10_CD_separated_interpolator = UnstructuredInterpolatedModel(
+        ln_CD_separated_interpolator = UnstructuredInterpolatedModel(
             x_data=alpha_resample,
-            y_data=np.log10(CD_if_separated)
+            y_data=np.log(CD_if_separated)
         )
         CM_separated_interpolator = UnstructuredInterpolatedModel(
             x_data=alpha_resample,
             y_data=CM_if_separated
         )
 
-        def CL_function(alpha, Re, mach=0):
-
-            alpha = np.mod(alpha + 180, 360) - 180  # Keep alpha in the valid range.
-            CL_attached = CL_attached_interpolator({
-                "alpha": alpha,
-                "ln_Re": np.log(Re),
-            })
-            CL_separated = CL_separated_interpolator(alpha)  # Lift coefficient if separated
-
-            CL_mach_0 = np.blend(  # Lift coefficient at mach = 0
-                separation_parameter(alpha, Re),
-                CL_separated,
-                CL_attached
-            )
+        ### Make the final polar functions, `CL_function(alpha, Re, mach)` and friends.
+        #
+        # All three share the same Mach-0 building blocks (wrapped alpha, ln(Re), the separation parameter,
+        # and the attached/separated interpolator evaluations), and a typical design loop queries CL, CD,
+        # and CM back-to-back at the same state - so we memoize those building blocks across the three
+        # closures. The memo is keyed by the identity of the `alpha` and `Re` inputs, and coefficients are
+        # only computed on first request, so a lone CL query doesn't pay for CD or CM interpolator
+        # evaluations. An identity hit on a small numeric input is additionally confirmed by value, so a
+        # caller that mutates a reused buffer in-place between queries still gets fresh results; CasADi
+        # types (where comparison by value isn't possible) and large arrays (where it isn't cheap) rely on
+        # identity alone.
+        _mach_0_cache = []  # Entries: (alpha, Re, alpha_snapshot, Re_snapshot, quantities_dict). Kept short.
+
+        def _value_snapshot(x):
+            # Returns a copy of `x` to validate future identity-keyed cache hits against, or None if
+            # identity alone must suffice (CasADi types, or arrays too large to be worth copying).
+            if np.is_casadi_type(x, recursive=False):
+                return None
+            x = np.array(x)
+            if x.size > 1000:
+                return None
+            return x.copy()
+
+        def _input_matches(cached_input, current_input, snapshot):
+            if cached_input is not current_input:
+                return False
+            if snapshot is None:
+                return True
+            return np.array_equal(snapshot, current_input)
+
+        t_over_c = self.max_thickness()
+        # Bound once here rather than queried per-call in the closures: the polars were generated for this
+        # geometry, so the thickness they assume should stay frozen even if `self.coordinates` is later changed.
+
+        _mach_0_interpolators = {
+            "CL"   : (CL_attached_interpolator, CL_separated_interpolator),
+            "ln_CD": (ln_CD_attached_interpolator, ln_CD_separated_interpolator),
+            "CM"   : (CM_attached_interpolator, CM_separated_interpolator),
+        }
 
-            if include_compressibility_effects:
-                prandtl_glauert_beta_squared_ideal = 1 - mach ** 2
+        def _mach_0_quantities(alpha, Re):
+            for cached_alpha, cached_Re, alpha_snapshot, Re_snapshot, cached_quantities in _mach_0_cache:
+                if (
+                        _input_matches(cached_alpha, alpha, alpha_snapshot) and
+                        _input_matches(cached_Re, Re, Re_snapshot)
+                ):
+                    return cached_quantities
+
+            alpha_wrapped = np.mod(alpha + 180, 360)  # Keep alpha in the valid range.
+            alpha_wrapped -= 180  # In-place on the freshly-allocated remainder, saving a third temporary.
+            quantities = {
+                "alpha"               : alpha_wrapped,
+                "interpolator_inputs" : {
+                    "alpha": alpha_wrapped,
+                    "ln_Re": np.log(Re),
+                },
+                "separation_parameter": separation_parameter(alpha_wrapped, Re),
+            }
 
-                prandtl_glauert_beta = np.softmax(
-                    prandtl_glauert_beta_squared_ideal,
-                    -prandtl_glauert_beta_squared_ideal,
-                    hardness=2.0  # Empirically tuned to data
-                ) ** 0.5
+            _mach_0_cache.append((alpha, Re, _value_snapshot(alpha), _value_snapshot(Re), quantities))
+            if len(_mach_0_cache) > 4:
+                _mach_0_cache.pop(0)
 
-                CL = CL_mach_0 / prandtl_glauert_beta
+            return quantities
 
-                mach_crit = transonic.mach_crit_Korn(
-                    CL=CL,
-                    t_over_c=self.max_thickness(),
-                    sweep=0,
-                    kappa_A=0.95
+        def _mach_0_coefficient(quantities, name):
+            if name not in quantities:
+                attached_interpolator, separated_interpolator = _mach_0_interpolators[name]
+                quantities[name] = np.blend(
+                    quantities["separation_parameter"],
+                    separated_interpolator(quantities["alpha"]),
+                    attached_interpolator(quantities["interpolator_inputs"]),
                 )
+            return quantities[name]
+
+        _beta_cache = []  # Entries: (mach, mach_snapshot, beta). Validated like _mach_0_cache.
+
+        def prandtl_glauert_beta(mach):
+            for cached_mach, mach_snapshot, cached_beta in _beta_cache:
+                if _input_matches(cached_mach, mach, mach_snapshot):
+                    return cached_beta
 
-                ### Accounts approximately for the lift drop due to buffet.
-                buffet_factor = np.blend(
-                    40 * (mach - mach_crit - (0.1 / 80) ** (1 / 3) - 0.06) * (mach - 1.1),
-                    1,
-                    transonic_buffet_lift_knockdown
+            prandtl_glauert_beta_squared_ideal = 1 - mach ** 2
+
+            beta = np.softmax(
+                prandtl_glauert_beta_squared_ideal,
+                -prandtl_glauert_beta_squared_ideal,
+                hardness=2.0  # Empirically tuned to data
+            ) ** 0.5
+
+            _beta_cache.append((mach, _value_snapshot(mach), beta))
+            if len(_beta_cache) > 4:
+                _beta_cache.pop(0)
+
+            return beta
+
+        ### `include_compressibility_effects` is fixed for the lifetime of the closures, so rather than
+        # re-testing it on every call, we build the specialized (branch-free) incompressible or compressible
+        # version of each function here, once.
+        if not include_compressibility_effects:
+
+            def CL_function(alpha, Re, mach=0):
+                return _mach_0_coefficient(  # Lift coefficient at mach = 0
+                    _mach_0_quantities(alpha, Re),
+                    "CL"
                 )
 
-                ### Accounts for the fact that theoretical CL_alpha goes from 2 * pi (subsonic) to 4 (supersonic),
-                # following linearized supersonic flow on a thin airfoil.
-                cla_supersonic_ratio_factor = np.blend(
-                    10 * (mach - 1),
-                    4 / (2 * np.pi),
-                    1,
+            def CD_function(alpha, Re, mach=0):
+                return np.exp(_mach_0_coefficient(
+                    _mach_0_quantities(alpha, Re),
+                    "ln_CD"
+                ))
+
+            def CM_function(alpha, Re, mach=0):
+                return _mach_0_coefficient(
+                    _mach_0_quantities(alpha, Re),
+                    "CM"
                 )
 
-                return CL * buffet_factor * cla_supersonic_ratio_factor
+            self.CL_function = CL_function
+            self.CD_function = CD_function
+            self.CM_function = CM_function
+            return
 
-            else:
-                return CL_mach_0
+        def CL_function(alpha, Re, mach=0):
 
-        def CD_function(alpha, Re, mach=0):
+            CL_mach_0 = _mach_0_coefficient(  # Lift coefficient at mach = 0
+                _mach_0_quantities(alpha, Re),
+                "CL"
+            )
+
+            CL = CL_mach_0 / prandtl_glauert_beta(mach)
 
-            alpha = np.mod(alpha + 180, 360) - 180  # Keep alpha in the valid range.
-            log10_CD_attached = log10_CD_attached_interpolator({
-                "alpha": alpha,
-                "ln_Re": np.log(Re),
-            })
-            log10_CD_separated = log10_CD_separated_interpolator(alpha)
-
-            log10_CD_mach_0 = np.blend(
-                separation_parameter(alpha, Re),
-                log10_CD_separated,
-                log10_CD_attached,
+            mach_crit = transonic.mach_crit_Korn(
+                CL=CL,
+                t_over_c=t_over_c,
+                sweep=0,
+                kappa_A=0.95
             )
 
-            if include_compressibility_effects:
+            ### Accounts approximately for the lift drop due to buffet.
+            buffet_factor = np.blend(
+                40 * (mach - mach_crit - (0.1 / 80) ** (1 / 3) - 0.06) * (mach - 1.1),
+                1,
+                transonic_buffet_lift_knockdown
+            )
 
-                CL_attached = CL_attached_interpolator({
-                    "alpha": alpha,
-                    "ln_Re": np.log(Re),
-                })
-                CL_separated = CL_separated_interpolator(alpha)
+            ### Accounts for the fact that theoretical CL_alpha goes from 2 * pi (subsonic) to 4 (supersonic),
+            # following linearized supersonic flow on a thin airfoil.
+            cla_supersonic_ratio_factor = np.blend(
+                10 * (mach - 1),
+                4 / (2 * np.pi),
+                1,
+            )
 
-                CL_mach_0 = np.blend(
-                    separation_parameter(alpha, Re),
-                    CL_separated,
-                    CL_attached
-                )
-                prandtl_glauert_beta_squared_ideal = 1 - mach ** 2
+            return CL * buffet_factor * cla_supersonic_ratio_factor
 
-                prandtl_glauert_beta = np.softmax(
-                    prandtl_glauert_beta_squared_ideal,
-                    -prandtl_glauert_beta_squared_ideal,
-                    hardness=2.0  # Empirically tuned to data
-                ) ** 0.5
+        def CD_function(alpha, Re, mach=0):
 
-                CL = CL_mach_0 / prandtl_glauert_beta
+            quantities = _mach_0_quantities(alpha, Re)
+            ln_CD_mach_0 = _mach_0_coefficient(quantities, "ln_CD")
 
-                t_over_c = self.max_thickness()
+            CL_mach_0 = _mach_0_coefficient(quantities, "CL")
 
-                mach_crit = transonic.mach_crit_Korn(
-                    CL=CL,
-                    t_over_c=t_over_c,
-                    sweep=0,
-                    kappa_A=0.92
+            CL = CL_mach_0 / prandtl_glauert_beta(mach)
+
+            mach_crit = transonic.mach_crit_Korn(
+                CL=CL,
+                t_over_c=t_over_c,
+                sweep=0,
+                kappa_A=0.92
+            )
+            mach_dd = mach_crit + (0.1 / 80) ** (1 / 3)
+
+            ### The wave drag model is piecewise in Mach; the pieces, in order, are:
+            # subcritical (zero), the initial drag rise, two cubic Hermite patches through the
+            # transonic regime, and a supersonic blend. On the symbolic (CasADi) path we have to
+            # express this as nested np.where() calls; on the numeric path, we instead evaluate
+            # each piece only on the samples where it actually applies, since a typical subsonic
+            # sweep would otherwise spend most of its time on masked-away transonic branches.
+            def CD_wave_drag_rise(mach, mach_crit):
+                # 20 * (mach - mach_crit) ** 4, via two squarings rather than a general pow().
+                mach_overshoot_squared = (mach - mach_crit) * (mach - mach_crit)
+                return 20 * mach_overshoot_squared * mach_overshoot_squared
+
+            def CD_wave_patch_1(mach, mach_dd):
+                return cubic_hermite_patch(
+                    mach,
+                    x_a=mach_dd,
+                    x_b=0.97,
+                    f_a=20 * (0.1 / 80) ** (4 / 3),
+                    f_b=0.8 * t_over_c,
+                    dfdx_a=0.1,
+                    dfdx_b=0.8 * t_over_c * 8
+                )
+
+            def CD_wave_patch_2(mach):
+                return cubic_hermite_patch(
+                    mach,
+                    x_a=0.97,
+                    x_b=1.1,
+                    f_a=0.8 * t_over_c,
+                    f_b=0.8 * t_over_c,
+                    dfdx_a=0.8 * t_over_c * 8,
+                    dfdx_b=-0.8 * t_over_c * 8,
                 )
-                mach_dd = mach_crit + (0.1 / 80) ** (1 / 3)
+
+            def CD_wave_supersonic(mach):
+                return np.blend(
+                    8 * 2 * (mach - 1.1) / (1.2 - 0.8),
+                    0.8 * 0.8 * t_over_c,
+                    1.2 * 0.8 * t_over_c,
+                )
+
+            if np.is_casadi_type(mach, recursive=False) or np.is_casadi_type(mach_crit, recursive=False):
                 CD_wave = np.where(
                     mach < mach_crit,
                     0,
                     np.where(
                         mach < mach_dd,
-                        20 * (mach - mach_crit) ** 4,
+                        CD_wave_drag_rise(mach, mach_crit),
                         np.where(
                             mach < 0.97,
-                            cubic_hermite_patch(
-                                mach,
-                                x_a=mach_dd,
-                                x_b=0.97,
-                                f_a=20 * (0.1 / 80) ** (4 / 3),
-                                f_b=0.8 * t_over_c,
-                                dfdx_a=0.1,
-                                dfdx_b=0.8 * t_over_c * 8
-                            ),
+                            CD_wave_patch_1(mach, mach_dd),
                             np.where(
                                 mach < 1.1,
-                                cubic_hermite_patch(
-                                    mach,
-                                    x_a=0.97,
-                                    x_b=1.1,
-                                    f_a=0.8 * t_over_c,
-                                    f_b=0.8 * t_over_c,
-                                    dfdx_a=0.8 * t_over_c * 8,
-                                    dfdx_b=-0.8 * t_over_c * 8,
-                                ),
-                                np.blend(
-                                    8 * 2 * (mach - 1.1) / (1.2 - 0.8),
-                                    0.8 * 0.8 * t_over_c,
-                                    1.2 * 0.8 * t_over_c,
-                                )
+                                CD_wave_patch_2(mach),
+                                CD_wave_supersonic(mach)
                             )
                         )
                     )
                 )
+            elif np.length(mach) == 1 and np.length(mach_crit) == 1:
+                # Scalar fast path: a plain if-chain evaluates exactly one piece.
+                mach_scalar = float(mach)
+                if mach_scalar < mach_crit:
+                    CD_wave = 0.
+                elif mach_scalar < mach_dd:
+                    CD_wave = CD_wave_drag_rise(mach_scalar, float(mach_crit))
+                elif mach_scalar < 0.97:
+                    CD_wave = CD_wave_patch_1(mach_scalar, float(mach_dd))
+                elif mach_scalar < 1.1:
+                    CD_wave = CD_wave_patch_2(mach_scalar)
+                else:
+                    CD_wave = CD_wave_supersonic(mach_scalar)
+            else:
+                mach_bc, mach_crit_bc, mach_dd_bc = np.broadcast_arrays(mach, mach_crit, mach_dd)
+                CD_wave = np.zeros_like(mach_bc, dtype=float)
 
-                # CD_wave = transonic.approximate_CD_wave(
-                #     mach=mach,
-                #     mach_crit=mach_crit,
-                #     CD_wave_at_fully_supersonic=0.90 * self.max_thickness()
-                # )
+                in_drag_rise = (mach_bc >= mach_crit_bc) & (mach_bc < mach_dd_bc)
+                if np.any(in_drag_rise):
+                    CD_wave[in_drag_rise] = CD_wave_drag_rise(mach_bc[in_drag_rise], mach_crit_bc[in_drag_rise])
 
-                return 10 ** log10_CD_mach_0 + CD_wave
+                in_patch_1 = (mach_bc >= mach_dd_bc) & (mach_bc < 0.97)
+                if np.any(in_patch_1):
+                    CD_wave[in_patch_1] = CD_wave_patch_1(mach_bc[in_patch_1], mach_dd_bc[in_patch_1])
 
+                in_patch_2 = (mach_bc >= 0.97) & (mach_bc < 1.1)
+                if np.any(in_patch_2):
+                    CD_wave[in_patch_2] = CD_wave_patch_2(mach_bc[in_patch_2])
 
-            else:
-                return 10 ** log10_CD_mach_0
+                in_supersonic = mach_bc >= 1.1
+                if np.any(in_supersonic):
+                    CD_wave[in_supersonic] = CD_wave_supersonic(mach_bc[in_supersonic])
+
+            # CD_wave = transonic.approximate_CD_wave(
+            #     mach=mach,
+            #     mach_crit=mach_crit,
+            #     CD_wave_at_fully_supersonic=0.90 * self.max_thickness()
+            # )
+
+            return np.exp(ln_CD_mach_0) + CD_wave
 
         def CM_function(alpha, Re, mach=0):
 
-            alpha = np.mod(alpha + 180, 360) - 180  # Keep alpha in the valid range.
-            CM_attached = CM_attached_interpolator({
-                "alpha": alpha,
-                "ln_Re": np.log(Re),
-            })
-            CM_separated = CM_separated_interpolator(alpha)
-
-            CM_mach_0 = np.blend(
-                separation_parameter(alpha, Re),
-                CM_separated,
-                CM_attached
+            CM_mach_0 = _mach_0_coefficient(
+                _mach_0_quantities(alpha, Re),
+                "CM"
             )
-            if include_compressibility_effects:
-                prandtl_glauert_beta_squared_ideal = 1 - mach ** 2
 
-                prandtl_glauert_beta = np.softmax(
-                    prandtl_glauert_beta_squared_ideal,
-                    -prandtl_glauert_beta_squared_ideal,
-                    hardness=2.0  # Empirically tuned to data
-                ) ** 0.5
-
-                CM = CM_mach_0 / prandtl_glauert_beta
-
-                return CM
-            else:
-                return CM_mach_0
+            return CM_mach_0 / prandtl_glauert_beta(mach)
 
         self.CL_function = CL_function
         self.CD_function = CD_function
@@ -638,17 +973,26 @@ class Airfoil(Polygon):
                 for color in Re_colors
             ]
 
+        ### Evaluate each polar function once over the whole (Re, alpha) grid, rather than once per Reynolds
+        # number - the polar functions are elementwise over same-shaped inputs, so this trades NRe closure
+        # invocations (each with its own interpolator setup) for a single batched one.
+        kwargs = dict(
+            alpha=np.tile(np.array(alphas), len(Res)),
+            Re=np.repeat(np.array(Res), len(alphas)),
+            mach=mach,
+        )
+        grid_shape = (len(Res), len(alphas))
+
+        CL_grid = np.reshape(self.CL_function(**kwargs), grid_shape)
+        CD_grid = np.reshape(self.CD_function(**kwargs), grid_shape)
+        CM_grid = np.reshape(self.CM_function(**kwargs), grid_shape)
+
         for i, Re in enumerate(Res):
-            kwargs = dict(
-                alpha=alphas,
-                Re=Re,
-                mach=mach
-            )
 
             plt.sca(ax[0, 0])
             plt.plot(
                 alphas,
-                self.CL_function(**kwargs),
+                CL_grid[i, :],
                 color=Re_colors[i],
                 alpha=0.7
             )
@@ -656,7 +1000,7 @@ class Airfoil(Polygon):
             plt.sca(ax[0, 1])
             plt.plot(
                 alphas,
-                self.CD_function(**kwargs),
+                CD_grid[i, :],
                 color=Re_colors[i],
                 alpha=0.7
             )
@@ -664,7 +1008,7 @@ class Airfoil(Polygon):
             plt.sca(ax[1, 0])
             plt.plot(
                 alphas,
-                self.CM_function(**kwargs),
+                CM_grid[i, :],
                 color=Re_colors[i],
                 alpha=0.7
             )
@@ -672,7 +1016,7 @@ class Airfoil(Polygon):
             plt.sca(ax[1, 1])
             plt.plot(
                 alphas,
-                self.CL_function(**kwargs) / self.CD_function(**kwargs),
+                CL_grid[i, :] / CD_grid[i, :],
                 color=Re_colors[i],
                 alpha=0.7
             )
@@ -696,36 +1040,75 @@ class Airfoil(Polygon):
                 legend=False,
             )
 
-    def local_camber(self,
-                     x_over_c: Union[float, np.ndarray] = np.linspace(0, 1, 101)
-                     ) -> Union[float, np.ndarray]:
+    def _local_surface_heights(self,
+                               x_over_c: Union[float, np.ndarray]
+                               ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
         """
-        Returns the local camber of the airfoil at a given point or points.
+        Returns the interpolated (upper, lower) surface heights (y/c) of the airfoil at the given x/c location(s).
 
-        Args:
-            x_over_c: The x/c locations to calculate the camber at [1D array, more generally, an iterable of floats]
+        Shared implementation for local_camber() and local_thickness(), which differ only in how they combine
+        the two surfaces.
 
-        Returns:
-            Local camber of the airfoil (y/c) [1D array].
+        The most recent result is memoized (keyed by the identity of `x_over_c`, and validated against the
+        identity of `self.coordinates`), so a camber query followed by a thickness query at the same points -
+        the common pairing - does the surface interpolation once.
         """
-        upper = self.upper_coordinates()[::-1]
-        lower = self.lower_coordinates()
+        memo = self.__dict__.get("_surface_heights_memo")
+        if memo is not None:
+            source_coordinates, source_x_over_c, value = memo
+            if source_coordinates is self.coordinates and source_x_over_c is x_over_c:
+                return value
+
+        def compute_surface_splits():
+            # Split the coordinates at the leading edge into four flat, contiguous arrays, with both surfaces
+            # ordered leading edge to trailing edge (i.e., ascending in x, as np.interp requires). Cached on the
+            # instance so that repeated queries don't re-materialize the reversed upper surface.
+            upper = self.upper_coordinates()[::-1]
+            lower = self.lower_coordinates()
+            return tuple(
+                np.ascontiguousarray(surface[:, axis])
+                for surface in [upper, lower]
+                for axis in [0, 1]
+            )
+
+        upper_x, upper_y, lower_x, lower_y = self._cached_geometry_value(
+            "surface_splits",
+            compute_surface_splits,
+        )
 
         upper_interpolated = np.interp(
             x_over_c,
-            upper[:, 0],
-            upper[:, 1],
+            upper_x,
+            upper_y,
         )
         lower_interpolated = np.interp(
             x_over_c,
-            lower[:, 0],
-            lower[:, 1],
+            lower_x,
+            lower_y,
         )
 
+        value = (upper_interpolated, lower_interpolated)
+        self._surface_heights_memo = (self.coordinates, x_over_c, value)
+        return value
+
+    def local_camber(self,
+                     x_over_c: Union[float, np.ndarray] = _default_x_over_c_sample
+                     ) -> Union[float, np.ndarray]:
+        """
+        Returns the local camber of the airfoil at a given point or points.
+
+        Args:
+            x_over_c: The x/c locations to calculate the camber at [1D array, more generally, an iterable of floats]
+
+        Returns:
+            Local camber of the airfoil (y/c) [1D array].
+        """
+        upper_interpolated, lower_interpolated = self._local_surface_heights(x_over_c)
+
         return (upper_interpolated + lower_interpolated) / 2
 
     def local_thickness(self,
-                        x_over_c: Union[float, np.ndarray] = np.linspace(0, 1, 101)
+                        x_over_c: Union[float, np.ndarray] = _default_x_over_c_sample
                         ) -> Union[float, np.ndarray]:
         """
         Returns the local thickness of the airfoil at a given point or points.
@@ -736,48 +1119,48 @@ class Airfoil(Polygon):
         Returns:
             Local thickness of the airfoil (y/c) [1D array].
         """
-        upper = self.upper_coordinates()[::-1]
-        lower = self.lower_coordinates()
-
-        upper_interpolated = np.interp(
-            x_over_c,
-            upper[:, 0],
-            upper[:, 1],
-        )
-        lower_interpolated = np.interp(
-            x_over_c,
-            lower[:, 0],
-            lower[:, 1],
-        )
+        upper_interpolated, lower_interpolated = self._local_surface_heights(x_over_c)
 
         return upper_interpolated - lower_interpolated
 
     def max_camber(self,
-                   x_over_c_sample: np.ndarray = np.linspace(0, 1, 101)
+                   x_over_c_sample: np.ndarray = None
                    ) -> float:
         """
         Returns the maximum camber of the airfoil.
 
         Args:
-            x_over_c_sample: Where should the airfoil be sampled to determine the max camber?
+            x_over_c_sample: Where should the airfoil be sampled to determine the max camber? If None (the
+            default), a uniform 101-point sample is used, and the result is cached on the instance.
 
         Returns: The maximum thickness, as a fraction of chord.
 
         """
+        if x_over_c_sample is None:
+            return self._cached_geometry_value(
+                "max_camber",
+                lambda: np.max(self.local_camber(x_over_c=_default_x_over_c_sample))
+            )
         return np.max(self.local_camber(x_over_c=x_over_c_sample))
 
     def max_thickness(self,
-                      x_over_c_sample: np.ndarray = np.linspace(0, 1, 101)
+                      x_over_c_sample: np.ndarray = None
                       ) -> float:
         """
         Returns the maximum thickness of the airfoil.
 
         Args:
-            x_over_c_sample: Where should the airfoil be sampled to determine the max thickness?
+            x_over_c_sample: Where should the airfoil be sampled to determine the max thickness? If None (the
+            default), a uniform 101-point sample is used, and the result is cached on the instance.
 
         Returns: The maximum thickness, as a fraction of chord.
 
         """
+        if x_over_c_sample is None:
+            return self._cached_geometry_value(
+                "max_thickness",
+                lambda: np.max(self.local_thickness(x_over_c=_default_x_over_c_sample))
+            )
         return np.max(self.local_thickness(x_over_c=x_over_c_sample))
 
     def draw(self,
@@ -800,7 +1183,9 @@ class Airfoil(Polygon):
         x = np.array(self.x()).reshape(-1)
         y = np.array(self.y()).reshape(-1)
         if draw_mcl:
-            x_mcl = np.linspace(np.min(x), np.max(x), len(x))
+            # By the coordinate-ordering convention, x is minimized at the leading edge and
+            # maximized at one of the trailing-edge endpoints - O(1) lookups, no full reductions.
+            x_mcl = np.linspace(x[self.LE_index()], max(x[0], x[-1]), len(x))
             y_mcl = self.local_camber(x_mcl)
 
         if backend == "matplotlib":
@@ -856,11 +1241,36 @@ class Airfoil(Polygon):
             else:
                 return fig
 
+    def _cached_geometry_value(self,
+                               key: str,
+                               compute: Callable[[], Any],
+                               ) -> Any:
+        """
+        A small instance-level memoizer for derived geometric quantities.
+
+        Values are keyed on `key`, and entries are validated against the identity of `self.coordinates`, so
+        assigning new coordinates invalidates them. Use only for quantities that are pure functions of the
+        coordinates.
+        """
+        cache = self.__dict__.setdefault("_geometry_cache", {})
+        entry = cache.get(key)
+        if entry is not None:
+            source_coordinates, value = entry
+            if source_coordinates is self.coordinates:
+                return value
+
+        value = compute()
+        cache[key] = (self.coordinates, value)
+        return value
+
     def LE_index(self) -> int:
         """
         Returns the index of the leading edge point in the airfoil coordinates.
         """
-        return np.argmin(self.x())
+        return self._cached_geometry_value(
+            "LE_index",
+            lambda: np.argmin(self.x())
+        )
 
     def lower_coordinates(self) -> np.ndarray:
         """
@@ -896,17 +1306,33 @@ class Airfoil(Polygon):
                 y_gap ** 2
         ) ** 0.5
 
+    def area(self) -> float:
+        """
+        Returns the area of the airfoil, in nondimensionalized (normalized-by-chord^2) units.
+
+        Identical to Polygon.area(), except the result is cached on the instance - cross-sectional areas get
+        queried per-section in wing volume and mass buildups.
+        """
+        return self._cached_geometry_value(
+            "area",
+            lambda: Polygon.area(self)
+        )
+
     def TE_angle(self) -> float:
         """
         Returns the trailing edge angle of the airfoil, in degrees.
         """
-        upper_TE_vec = self.coordinates[0, :] - self.coordinates[1, :]
-        lower_TE_vec = self.coordinates[-1, :] - self.coordinates[-2, :]
-
-        return np.arctan2d(
-            upper_TE_vec[0] * lower_TE_vec[1] - upper_TE_vec[1] * lower_TE_vec[0],
-            upper_TE_vec[0] * lower_TE_vec[0] + upper_TE_vec[1] * upper_TE_vec[1]
-        )
+        # Plain-float math: these are four scalar subtractions and an atan2, for which numpy's
+        # ufunc dispatch overhead dwarfs the arithmetic itself.
+        upper_TE_x = float(self.coordinates[0, 0] - self.coordinates[1, 0])
+        upper_TE_y = float(self.coordinates[0, 1] - self.coordinates[1, 1])
+        lower_TE_x = float(self.coordinates[-1, 0] - self.coordinates[-2, 0])
+        lower_TE_y = float(self.coordinates[-1, 1] - self.coordinates[-2, 1])
+
+        return math.degrees(math.atan2(
+            upper_TE_x * lower_TE_y - upper_TE_y * lower_TE_x,
+            upper_TE_x * lower_TE_x + upper_TE_y * lower_TE_y
+        ))
 
     # def LE_radius(self) -> float:
     #     """
@@ -934,18 +1360,17 @@ class Airfoil(Polygon):
         Returns: A copy of the airfoil with the new coordinates.
         """
 
-        upper_original_coors = self.upper_coordinates()  # Note: includes leading edge point, be careful about duplicates
-        lower_original_coors = self.lower_coordinates()  # Note: includes leading edge point, be careful about duplicates
-
-        # Find distances between coordinates, assuming linear interpolation
-        upper_distances_between_points = (
-                                                 (upper_original_coors[:-1, 0] - upper_original_coors[1:, 0]) ** 2 +
-                                                 (upper_original_coors[:-1, 1] - upper_original_coors[1:, 1]) ** 2
-                                         ) ** 0.5
-        lower_distances_between_points = (
-                                                 (lower_original_coors[:-1, 0] - lower_original_coors[1:, 0]) ** 2 +
-                                                 (lower_original_coors[:-1, 1] - lower_original_coors[1:, 1]) ** 2
-                                         ) ** 0.5
+        # Find distances between coordinates, assuming linear interpolation. One hypot pass over the full
+        # coordinate array, split at the leading edge, covers both surfaces (the upper surface owns the
+        # segments up to the LE point, the lower surface the rest).
+        distances_between_points = np.hypot(
+            np.diff(self.coordinates[:, 0]),
+            np.diff(self.coordinates[:, 1]),
+        )
+        LE_index = self.LE_index()
+        upper_distances_between_points = distances_between_points[:LE_index]
+        lower_distances_between_points = distances_between_points[LE_index:]
+
         upper_distances_from_TE = np.hstack((0, np.cumsum(upper_distances_between_points)))
         lower_distances_from_LE = np.hstack((0, np.cumsum(lower_distances_between_points)))
         upper_distances_from_TE_normalized = upper_distances_from_TE / upper_distances_from_TE[-1]
@@ -963,28 +1388,58 @@ class Airfoil(Polygon):
             1 + spaced_points[1:],
         ))
 
-        # Check that there are no duplicate points in the airfoil.
-        if np.any(np.diff(distances_from_TE_normalized) == 0):
+        # Check that there are no duplicate points in the airfoil. A duplicated point is exactly a
+        # zero-length segment, so the segment lengths computed above can be checked directly instead
+        # of re-diffing the (monotonic-by-construction) normalized distances.
+        if np.any(distances_between_points == 0):
             raise ValueError(
                 "This airfoil has a duplicated point (i.e. two adjacent points with the same (x, y) coordinates), so you can't repanel it!")
 
-        x = interpolate.PchipInterpolator(
-            distances_from_TE_normalized,
-            self.x(),
-        )(s)
-        y = interpolate.PchipInterpolator(
+        from scipy import interpolate
+
+        # One 2D PCHIP construction interpolates both x and y: the Fritsch-Carlson derivative setup runs
+        # per-column, so this is identical to (but half the object overhead of) two 1D interpolators.
+        coordinates = interpolate.PchipInterpolator(
             distances_from_TE_normalized,
-            self.y(),
+            self.coordinates,
+            axis=0,
         )(s)
 
         return Airfoil(
             name=self.name,
-            coordinates=stack_coordinates(x, y),
+            coordinates=coordinates,
             CL_function=self.CL_function,
             CD_function=self.CD_function,
             CM_function=self.CM_function,
         )
 
+    def _repaneled_coordinates(self,
+                               n_points_per_side: int = 100,
+                               spacing_function_per_side=np.cosspace,
+                               ) -> np.ndarray:
+        """
+        Identical to `Airfoil.repanel(...).coordinates`, except that results are cached on the instance.
+
+        Meshing code (e.g., `Wing.mesh_body`) tends to request the same repanelization of the same Airfoil object
+        over and over; caching here means the spline fits in `repanel()` only run once per (airfoil, panelization).
+        Cache entries are validated against the identity of `self.coordinates`, so reassigning the coordinates
+        invalidates them.
+        """
+        cache = self.__dict__.setdefault("_repanel_cache", {})
+        key = (n_points_per_side, spacing_function_per_side)
+        entry = cache.get(key)
+        if entry is not None:
+            source_coordinates, repaneled_coordinates = entry
+            if source_coordinates is self.coordinates:
+                return repaneled_coordinates
+
+        repaneled_coordinates = self.repanel(
+            n_points_per_side=n_points_per_side,
+            spacing_function_per_side=spacing_function_per_side,
+        ).coordinates
+        cache[key] = (self.coordinates, repaneled_coordinates)
+        return repaneled_coordinates
+
     def add_control_surface(
             self,
             deflection: float = 0.,
@@ -1005,70 +1460,70 @@ class Airfoil(Polygon):
         """
         if modify_coordinates:
             # Find the hinge point
-            hinge_point_y = np.where(
-                deflection > 0,
-                self.local_camber(hinge_point_x) - self.local_thickness(hinge_point_x) / 2,
-                self.local_camber(hinge_point_x) + self.local_thickness(hinge_point_x) / 2,
-            )
+            camber = self.local_camber(hinge_point_x)
+            half_thickness = self.local_thickness(hinge_point_x) / 2
+
+            if np.is_casadi_type(deflection, recursive=False):  # Symbolic deflection: keep both branches in the graph.
+                hinge_point_y = np.where(
+                    deflection > 0,
+                    camber - half_thickness,
+                    camber + half_thickness,
+                )
+            else:
+                hinge_point_y = (
+                    camber - half_thickness
+                    if deflection > 0 else
+                    camber + half_thickness
+                )
 
             # hinge_point_y = self.local_camber(hinge_point_x)
-            hinge_point = np.reshape(
-                np.array([hinge_point_x, hinge_point_y]),
-                (1, 2)
-            )
+
+            cosd_half_deflection = np.cosd(deflection / 2)
+            sind_half_deflection = np.sind(deflection / 2)
 
             def is_behind_hinge(xy: np.ndarray) -> np.ndarray:
                 return (
-                        (xy[:, 0] - hinge_point_x) * np.cosd(deflection / 2) -
-                        (xy[:, 1] - hinge_point_y) * np.sind(deflection / 2)
+                        (xy[:, 0] - hinge_point_x) * cosd_half_deflection -
+                        (xy[:, 1] - hinge_point_y) * sind_half_deflection
                         > 0
                 )
 
             orig_u = self.upper_coordinates()
             orig_l = self.lower_coordinates()
 
-            rotation_matrix = np.rotation_matrix_2D(
+            # Rotate about the hinge point, working columnwise: scalar-vector broadcasting avoids
+            # tiling the hinge point into (N, 2) arrays, and works on both backends.
+            (r_xx, r_xy), (r_yx, r_yy) = np.rotation_matrix_2D(
                 angle=-np.radians(deflection),
+                as_array=False,
             )
 
-            def T(xy):
-                return np.transpose(xy)
+            def rotate_about_hinge(xy: np.ndarray) -> np.ndarray:
+                dx = xy[:, 0] - hinge_point_x
+                dy = xy[:, 1] - hinge_point_y
+                return np.stack([
+                    r_xx * dx + r_xy * dy + hinge_point_x,
+                    r_yx * dx + r_yy * dy + hinge_point_y,
+                ], axis=1)
 
-            hinge_point_u = np.tile(hinge_point, (np.length(orig_u), 1))
-            hinge_point_l = np.tile(hinge_point, (np.length(orig_l), 1))
+            rot_u = rotate_about_hinge(orig_u)
+            rot_l = rotate_about_hinge(orig_l)
 
-            rot_u = T(rotation_matrix @ T(orig_u - hinge_point_u)) + hinge_point_u
-            rot_l = T(rotation_matrix @ T(orig_l - hinge_point_l)) + hinge_point_l
+            behind_hinge_u = is_behind_hinge(rot_u)
+            behind_hinge_l = is_behind_hinge(rot_l)
 
-            coordinates_x = np.concatenate([
+            coordinates = np.concatenate([
                 np.where(
-                    is_behind_hinge(rot_u),
-                    rot_u[:, 0],
-                    orig_u[:, 0]
+                    np.stack([behind_hinge_u, behind_hinge_u], axis=1),
+                    rot_u,
+                    orig_u
                 ),
                 np.where(
-                    is_behind_hinge(rot_l),
-                    rot_l[:, 0],
-                    orig_l[:, 0]
+                    np.stack([behind_hinge_l, behind_hinge_l], axis=1),
+                    rot_l,
+                    orig_l
                 )
-            ])
-            coordinates_y = np.concatenate([
-                np.where(
-                    is_behind_hinge(rot_u),
-                    rot_u[:, 1],
-                    orig_u[:, 1]
-                ),
-                np.where(
-                    is_behind_hinge(rot_l),
-                    rot_l[:, 1],
-                    orig_l[:, 1]
-                )
-            ])
-
-            coordinates = np.stack([
-                coordinates_x,
-                coordinates_y
-            ], axis=1)
+            ], axis=0)
         else:
             coordinates = self.coordinates
 
@@ -1156,21 +1611,19 @@ class Airfoil(Polygon):
 
         te_x = (ux[0] + lx[-1]) / 2
 
-        ### Create modified versions of the upper and lower coordinates
-        new_u = np.stack(
-            arrays=[
-                ux + x_adjustment * (ux - le_x) / (te_x - le_x),
-                uy + y_adjustment * (ux - le_x) / (te_x - le_x)
-            ],
-            axis=1
-        )
-        new_l = np.stack(
-            arrays=[
-                lx - x_adjustment * (lx - le_x) / (te_x - le_x),
-                ly - y_adjustment * (lx - le_x) / (te_x - le_x)
-            ],
-            axis=1
-        )
+        ### Compute the chord-normalized distance of each point from the leading edge, for each side.
+        u_frac = (ux - le_x) / (te_x - le_x)
+        l_frac = (lx - le_x) / (te_x - le_x)
+
+        ### Create modified versions of the upper and lower coordinates, assigning columns into
+        ### preallocated arrays rather than stacking (which would box the columns in a list first).
+        new_u = np.empty_like(u)
+        new_u[:, 0] = ux + x_adjustment * u_frac
+        new_u[:, 1] = uy + y_adjustment * u_frac
+
+        new_l = np.empty_like(l)
+        new_l[:, 0] = lx - x_adjustment * l_frac
+        new_l[:, 1] = ly - y_adjustment * l_frac
 
         ### If the desired thickness is zero, ensure that is precisely reached.
         if thickness == 0:
@@ -1203,16 +1656,29 @@ class Airfoil(Polygon):
 
         Returns: The scaled Airfoil.
         """
-        x = self.x() * scale_x
-        y = self.y() * scale_y
+        if scale_x == 1 and scale_y == 1:  # Identity scaling; coordinates are immutable-by-convention, so share them.
+            return Airfoil(
+                name=self.name,
+                coordinates=self.coordinates
+            )
+
+        if np.is_casadi_type(self.coordinates, recursive=False):
+            # CasADi matrices don't broadcast against a 2-vector, so scale the columns separately.
+            coordinates = stack_coordinates(
+                self.x() * scale_x,
+                self.y() * scale_y,
+            )
+        else:
+            coordinates = self.coordinates * np.array([scale_x, scale_y])
 
         if scale_y < 0:
-            x = x[::-1]
-            y = y[::-1]
+            coordinates = coordinates[::-1, :]  # Explicit 2D slice: a bare [::-1] would flatten a CasADi matrix.
+            if not np.is_casadi_type(coordinates, recursive=False):
+                coordinates = np.ascontiguousarray(coordinates)
 
         return Airfoil(
             name=self.name,
-            coordinates=stack_coordinates(x, y)
+            coordinates=coordinates
         )
 
     def translate(self,
@@ -1228,12 +1694,18 @@ class Airfoil(Polygon):
         Returns: The translated Airfoil.
 
         """
-        x = self.x() + translate_x
-        y = self.y() + translate_y
+        if np.is_casadi_type(self.coordinates, recursive=False):
+            # CasADi matrices don't broadcast against a 2-vector, so translate the columns separately.
+            coordinates = stack_coordinates(
+                self.x() + translate_x,
+                self.y() + translate_y,
+            )
+        else:
+            coordinates = self.coordinates + np.array([translate_x, translate_y])
 
         return Airfoil(
             name=self.name,
-            coordinates=stack_coordinates(x, y)
+            coordinates=coordinates
         )
 
     def rotate(self,
@@ -1257,20 +1729,12 @@ class Airfoil(Polygon):
 
         """
 
-        coordinates = np.copy(self.coordinates)
-
-        ### Translate
+        ### Translate, rotate, un-translate, in one expression (no up-front copy needed).
         translation = np.array([x_center, y_center])
-        coordinates -= translation
-
-        ### Rotate
         rotation_matrix = np.rotation_matrix_2D(
             angle=angle,
         )
-        coordinates = (rotation_matrix @ coordinates.T).T
-
-        ### Translate
-        coordinates += translation
+        coordinates = (self.coordinates - translation) @ np.transpose(rotation_matrix) + translation
 
         return Airfoil(
             name=self.name,
@@ -1300,34 +1764,38 @@ class Airfoil(Polygon):
         Returns: A new airfoil that is a blend of this airfoil and another one.
 
         """
-        this_foil = self.repanel(n_points_per_side=n_points_per_side)
-        that_foil = airfoil.repanel(n_points_per_side=n_points_per_side)
+        # The repaneled coordinates are pulled from the per-instance cache, so blending the same
+        # two airfoils at many fractions (e.g., a morphing sweep along a wing) repanels each
+        # airfoil only once. Polar functions are unaffected by repaneling, so the originals are
+        # blended directly.
+        this_coordinates = self._repaneled_coordinates(n_points_per_side=n_points_per_side)
+        that_coordinates = airfoil._repaneled_coordinates(n_points_per_side=n_points_per_side)
         this_fraction = 1 - blend_fraction
         that_fraction = blend_fraction
 
         name = f"{this_fraction * 100:.0f}% {self.name}, {that_fraction * 100:.0f}% {airfoil.name}"
 
-        coordinates = (
-                this_fraction * this_foil.coordinates +
-                that_fraction * that_foil.coordinates
-        )
+        # In-place accumulation: the left-hand product is a fresh array, so adding into it saves
+        # one (N, 2) temporary.
+        coordinates = this_fraction * this_coordinates
+        coordinates += that_fraction * that_coordinates
 
         def CL_function(alpha, Re, mach):
             return (
-                    this_fraction * this_foil.CL_function(alpha, Re, mach) +
-                    that_fraction * that_foil.CL_function(alpha, Re, mach)
+                    this_fraction * self.CL_function(alpha, Re, mach) +
+                    that_fraction * airfoil.CL_function(alpha, Re, mach)
             )
 
         def CD_function(alpha, Re, mach):
             return (
-                    this_fraction * this_foil.CD_function(alpha, Re, mach) +
-                    that_fraction * that_foil.CD_function(alpha, Re, mach)
+                    this_fraction * self.CD_function(alpha, Re, mach) +
+                    that_fraction * airfoil.CD_function(alpha, Re, mach)
             )
 
         def CM_function(alpha, Re, mach):
             return (
-                    this_fraction * this_foil.CM_function(alpha, Re, mach) +
-                    that_fraction * that_foil.CM_function(alpha, Re, mach)
+                    this_fraction * self.CM_function(alpha, Re, mach) +
+                    that_fraction * airfoil.CM_function(alpha, Re, mach)
             )
 
         return Airfoil(
@@ -1357,14 +1825,14 @@ class Airfoil(Polygon):
         Returns: None
 
         """
-        contents = []
+        buffer = io.StringIO()
 
         if include_name:
-            contents += [self.name]
+            buffer.write(self.name + "\n")
 
-        contents += ["%f %f" % tuple(coordinate) for coordinate in self.coordinates]
+        np.savetxt(buffer, self.coordinates, fmt="%f %f")
 
-        string = "\n".join(contents)
+        string = buffer.getvalue().rstrip("\n")
 
         if filepath is not None:
             with open(filepath, "w+") as f:
@@ -1385,12 +1853,9 @@ class Airfoil(Polygon):
         Returns: None
 
         """
-        string = "\n".join(
-            [
-                "%f %f 0" % tuple(coordinate)
-                for coordinate in self.coordinates
-            ]
-        )
+        buffer = io.StringIO()
+        np.savetxt(buffer, self.coordinates, fmt="%f %f 0")
+        string = buffer.getvalue().rstrip("\n")
 
         if filepath is not None:
             with open(filepath, "w+") as f:
@@ -1545,6 +2010,7 @@ class Airfoil(Polygon):
     # def plot_xfoil_data_contours(self):
     #     self.has_xfoil_data()  # Ensure data is present.
     #     from matplotlib import colors
+    #     from matplotlib.tri import Triangulation
     #
     #     d = self.xfoil_data_1D  # data
     #
@@ -1562,11 +2028,15 @@ class Airfoil(Polygon):
     #         ax = fig.add_subplot(323)
     #         x = d["Re"]
     #         y = d["alpha"]
+    #         # One Triangulation serves the filled/line contour pair in each subplot (and is
+    #         # reused across subplots with the same point set); triangulating is the dominant
+    #         # cost of tricontourf, so this roughly halves each panel's plot time.
+    #         tri = Triangulation(x, y)
     #         z = d["Cl"]
     #         levels = np.linspace(-0.5, 1.5, 21)
     #         norm = None
-    #         CF = ax.tricontourf(x, y, z, levels=levels, norm=norm, cmap="plasma", extend="both")
-    #         C = ax.tricontour(x, y, z, levels=levels, norm=norm, colors='k', extend="both", linewidths=0.5)
+    #         CF = ax.tricontourf(tri, z, levels=levels, norm=norm, cmap="plasma", extend="both")
+    #         C = ax.tricontour(tri, z, levels=levels, norm=norm, colors='k', extend="both", linewidths=0.5)
     #         cbar = plt.colorbar(CF, format='%.2f')
     #         cbar.set_label(r"$C_l$")
     #         plt.grid(False)
@@ -1581,8 +2051,8 @@ class Airfoil(Polygon):
     #         z = d["Cd"]
     #         levels = np.logspace(-2.5, -1, 21)
     #         norm = colors.PowerNorm(gamma=1 / 2, vmin=np.min(levels), vmax=np.max(levels))
-    #         CF = ax.tricontourf(x, y, z, levels=levels, norm=norm, cmap="plasma", extend="both")
-    #         C = ax.tricontour(x, y, z, levels=levels, norm=norm, colors='k', extend="both", linewidths=0.5)
+    #         CF = ax.tricontourf(tri, z, levels=levels, norm=norm, cmap="plasma", extend="both")
+    #         C = ax.tricontour(tri, z, levels=levels, norm=norm, colors='k', extend="both", linewidths=0.5)
     #         cbar = plt.colorbar(CF, format='%.3f')
     #         cbar.set_label(r"$C_d$")
     #         plt.grid(False)
@@ -1598,10 +2068,11 @@ class Airfoil(Polygon):
     #         x = x[d["alpha"] >= 0]
     #         y = y[d["alpha"] >= 0]
     #         z = z[d["alpha"] >= 0]
+    #         tri_positive_alpha = Triangulation(x, y)
     #         levels = np.logspace(1, np.log10(150), 21)
     #         norm = colors.PowerNorm(gamma=1 / 2, vmin=np.min(levels), vmax=np.max(levels))
-    #         CF = ax.tricontourf(x, y, z, levels=levels, norm=norm, cmap="plasma", extend="both")
-    #         C = ax.tricontour(x, y, z, levels=levels, norm=norm, colors='k', extend="both", linewidths=0.5)
+    #         CF = ax.tricontourf(tri_positive_alpha, z, levels=levels, norm=norm, cmap="plasma", extend="both")
+    #         C = ax.tricontour(tri_positive_alpha, z, levels=levels, norm=norm, colors='k', extend="both", linewidths=0.5)
     #         cbar = plt.colorbar(CF, format='%.1f')
     #         cbar.set_label(r"$L/D$")
     #         plt.grid(False)
@@ -1616,8 +2087,8 @@ class Airfoil(Polygon):
     #         z = d["Cm"]
     #         levels = np.linspace(-0.15, 0, 21)  # np.logspace(1, np.log10(150), 21)
     #         norm = None  # colors.PowerNorm(gamma=1 / 2, vmin=np.min(levels), vmax=np.max(levels))
-    #         CF = ax.tricontourf(x, y, z, levels=levels, norm=norm, cmap="plasma", extend="both")
-    #         C = ax.tricontour(x, y, z, levels=levels, norm=norm, colors='k', extend="both", linewidths=0.5)
+    #         CF = ax.tricontourf(tri, z, levels=levels, norm=norm, cmap="plasma", extend="both")
+    #         C = ax.tricontour(tri, z, levels=levels, norm=norm, colors='k', extend="both", linewidths=0.5)
     #         cbar = plt.colorbar(CF, format='%.2f')
     #         cbar.set_label(r"$C_m$")
     #         plt.grid(False)
@@ -1657,10 +2128,14 @@ class Airfoil(Polygon):
     #     ]
     #     indices = indices[indices_worth_plotting]
     #
-    #     colors = plt.cm.rainbow(np.linspace(0, 1, len(indices)))[::-1]
+    #     colors = plt.get_cmap('rainbow_r')(np.linspace(0, 1, len(indices)))  # Pre-reversed map; skips the copy.
     #     for i, Re in enumerate(self.xfoil_data_2D["Re_indices"][indices]):
-    #         Cds = remove_nans(self.xfoil_data_2D["Cd"][indices[i], :])
-    #         Cls = remove_nans(self.xfoil_data_2D["Cl"][indices[i], :])
+    #         # One shared mask keeps Cd and Cl paired; removing NaNs independently could
+    #         # desynchronize the two arrays if only one of them failed to converge at a point.
+    #         finite = np.isfinite(self.xfoil_data_2D["Cd"][indices[i], :]) & \
+    #                  np.isfinite(self.xfoil_data_2D["Cl"][indices[i], :])
+    #         Cds = self.xfoil_data_2D["Cd"][indices[i], finite]
+    #         Cls = self.xfoil_data_2D["Cl"][indices[i], finite]
     #         Cd_min = np.min(Cds)
     #         if Cd_min < Cd_plot_max:
     #             plt.plot(
@@ -1706,7 +2181,7 @@ class Airfoil(Polygon):
     #         Res = [Res]
     #
     #     fig, ax = plt.subplots(1, 1, figsize=(7, 6), dpi=200)
-    #     colors = plt.cm.rainbow(np.linspace(0, 1, len(Res)))[::-1]
+    #     colors = plt.get_cmap('rainbow_r')(np.linspace(0, 1, len(Res)))  # Pre-reversed map; skips the copy.
     #
     #     def get_xfoil_data_at_Re(Re):
     #
@@ -1721,9 +2196,8 @@ class Airfoil(Polygon):
     #             max_iter=max_iter,
     #             verbose=False,
     #         )
-    #         Cd = remove_nans(xfoil_data["Cd"])
-    #         Cl = remove_nans(xfoil_data["Cl"])
-    #         return {"Cl": Cl, "Cd": Cd}
+    #         finite = np.isfinite(xfoil_data["Cd"]) & np.isfinite(xfoil_data["Cl"])  # One mask keeps Cd/Cl paired.
+    #         return {"Cl": xfoil_data["Cl"][finite], "Cd": xfoil_data["Cd"][finite]}
     #
     #     if verbose:
     #         print("Running XFoil sweeps...")
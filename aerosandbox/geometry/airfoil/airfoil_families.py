@@ -108,10 +108,12 @@ def get_NACA_coordinates(
     theta = np.arctan(dycdx)
 
     # Combine everything
-    x_U = x_t - y_t * np.sin(theta)
-    x_L = x_t + y_t * np.sin(theta)
-    y_U = y_c + y_t * np.cos(theta)
-    y_L = y_c - y_t * np.cos(theta)
+    y_t_sin_theta = y_t * np.sin(theta)
+    y_t_cos_theta = y_t * np.cos(theta)
+    x_U = x_t - y_t_sin_theta
+    x_L = x_t + y_t_sin_theta
+    y_U = y_c + y_t_cos_theta
+    y_L = y_c - y_t_cos_theta
 
     # Flip upper surface so it's back to front
     x_U, y_U = x_U[::-1], y_U[::-1]
@@ -320,84 +320,33 @@ class Airplane(AeroSandboxObject):
         else:
             raise ValueError("Bad value of `backend`!")
 
-    def draw_wireframe(self,
-                       ax=None,
-                       color="k",
-                       thin_linewidth=0.2,
-                       thick_linewidth=0.5,
-                       fuselage_longeron_theta=None,
-                       use_preset_view_angle: str = None,
-                       set_background_pane_color: Union[str, Tuple[float, float, float]] = None,
-                       set_background_pane_alpha: float = None,
-                       set_equal: bool = True,
-                       set_axis_visibility: bool = None,
-                       show: bool = True,
-                       ):
+    def _compute_wireframe_lines(self,
+                                 color="k",
+                                 thin_linewidth=0.2,
+                                 thick_linewidth=0.5,
+                                 fuselage_longeron_theta=None,
+                                 ) -> List[Dict[str, Any]]:
         """
-        Draws a wireframe of the airplane on a Matplotlib 3D axis.
+        Computes the lines that make up this airplane's wireframe drawing, without plotting them.
 
-        Args:
+        Each line is a dict of keyword arguments (xyz coordinates, styling) to be drawn by `Airplane.draw_wireframe`.
+        Splitting this out lets callers that draw the same airplane onto several axes (e.g.,
+        `Airplane.draw_three_view`) compute the wireframe geometry only once.
 
-            ax: The axis to draw on. Must be a 3D axis. If None, creates a new axis.
+        Args: See `Airplane.draw_wireframe`.
 
-            color: The color of the wireframe.
-
-            thin_linewidth: The linewidth of the thin lines.
+        Returns: A list of dicts, each representing one polyline of the wireframe.
         """
-        import matplotlib.pyplot as plt
-        import aerosandbox.tools.pretty_plots as p
-
-        if ax is None:
-            fig, ax = p.figure3d(figsize=(8, 8))
-        else:
-            if not p.ax_is_3d(ax):
-                raise ValueError("`ax` must be a 3D axis.")
-
-            plt.sca(ax)
-
-        ### Set the view angle
-        if use_preset_view_angle is not None:
-            p.set_preset_3d_view_angle(use_preset_view_angle)
-
-        ### Set the background pane color
-        if set_background_pane_color is not None:
-            ax.xaxis.pane.set_facecolor(set_background_pane_color)
-            ax.yaxis.pane.set_facecolor(set_background_pane_color)
-            ax.zaxis.pane.set_facecolor(set_background_pane_color)
-
-        ### Set the background pane alpha
-        if set_background_pane_alpha is not None:
-            ax.xaxis.pane.set_alpha(set_background_pane_alpha)
-            ax.yaxis.pane.set_alpha(set_background_pane_alpha)
-            ax.zaxis.pane.set_alpha(set_background_pane_alpha)
-
         if fuselage_longeron_theta is None:
             fuselage_longeron_theta = np.linspace(0, 2 * np.pi, 8 + 1)[:-1]
 
+        lines = []
+
         def plot_line(
                 xyz,
-                symmetric=False,
-                fmt="-",
-                color=color,
-                linewidth=0.4,
                 **kwargs
         ):
-            if symmetric:
-                xyz = np.concatenate([
-                    xyz,
-                    np.array([np.nan] * 3).reshape((1, -1)),
-                    xyz * np.array([1, -1, 1])
-                ], axis=0)
-
-            ax.plot(
-                xyz[:, 0],
-                xyz[:, 1],
-                xyz[:, 2],
-                fmt,
-                color=color,
-                linewidth=linewidth,
-                **kwargs
-            )
+            lines.append(dict(xyz=xyz, **kwargs))
 
         def reshape(x):
             return np.array(x).reshape((1, 3))
@@ -532,6 +481,100 @@ class Airplane(AeroSandboxObject):
                     color=color_to_use
                 )
 
+        return lines
+
+    def draw_wireframe(self,
+                       ax=None,
+                       color="k",
+                       thin_linewidth=0.2,
+                       thick_linewidth=0.5,
+                       fuselage_longeron_theta=None,
+                       use_preset_view_angle: str = None,
+                       set_background_pane_color: Union[str, Tuple[float, float, float]] = None,
+                       set_background_pane_alpha: float = None,
+                       set_equal: bool = True,
+                       set_axis_visibility: bool = None,
+                       show: bool = True,
+                       _lines: List[Dict[str, Any]] = None,
+                       ):
+        """
+        Draws a wireframe of the airplane on a Matplotlib 3D axis.
+
+        Args:
+
+            ax: The axis to draw on. Must be a 3D axis. If None, creates a new axis.
+
+            color: The color of the wireframe.
+
+            thin_linewidth: The linewidth of the thin lines.
+
+            _lines: Precomputed wireframe lines from `Airplane._compute_wireframe_lines`, if you've already computed
+            them (e.g., because you're drawing the same airplane onto several axes). If None, they're computed here.
+        """
+        import matplotlib.pyplot as plt
+        import aerosandbox.tools.pretty_plots as p
+
+        if ax is None:
+            fig, ax = p.figure3d(figsize=(8, 8))
+        else:
+            if not p.ax_is_3d(ax):
+                raise ValueError("`ax` must be a 3D axis.")
+
+            plt.sca(ax)
+
+        ### Set the view angle
+        if use_preset_view_angle is not None:
+            p.set_preset_3d_view_angle(use_preset_view_angle)
+
+        ### Set the background pane color
+        if set_background_pane_color is not None:
+            ax.xaxis.pane.set_facecolor(set_background_pane_color)
+            ax.yaxis.pane.set_facecolor(set_background_pane_color)
+            ax.zaxis.pane.set_facecolor(set_background_pane_color)
+
+        ### Set the background pane alpha
+        if set_background_pane_alpha is not None:
+            ax.xaxis.pane.set_alpha(set_background_pane_alpha)
+            ax.yaxis.pane.set_alpha(set_background_pane_alpha)
+            ax.zaxis.pane.set_alpha(set_background_pane_alpha)
+
+        ### Compute the wireframe lines, if they weren't already given
+        if _lines is None:
+            _lines = self._compute_wireframe_lines(
+                color=color,
+                thin_linewidth=thin_linewidth,
+                thick_linewidth=thick_linewidth,
+                fuselage_longeron_theta=fuselage_longeron_theta,
+            )
+
+        def plot_line(
+                xyz,
+                symmetric=False,
+                fmt="-",
+                color=color,
+                linewidth=0.4,
+                **kwargs
+        ):
+            if symmetric:
+                xyz = np.concatenate([
+                    xyz,
+                    np.array([np.nan] * 3).reshape((1, -1)),
+                    xyz * np.array([1, -1, 1])
+                ], axis=0)
+
+            ax.plot(
+                xyz[:, 0],
+                xyz[:, 1],
+                xyz[:, 2],
+                fmt,
+                color=color,
+                linewidth=linewidth,
+                **kwargs
+            )
+
+        for line in _lines:
+            plot_line(**line)
+
         if set_equal:
             p.equal()
 
@@ -561,6 +604,8 @@ class Airplane(AeroSandboxObject):
             figsize=(8, 8)
         )
 
+        wireframe_lines = self._compute_wireframe_lines()  # Compute the wireframe geometry once, for all four views.
+
         for i in range(axs.shape[0]):
             for j in range(axs.shape[1]):
                 ax = axs[i, j]
@@ -569,7 +614,8 @@ class Airplane(AeroSandboxObject):
                 self.draw_wireframe(
                     ax=ax,
                     set_axis_visibility=False if 'isometric' in preset_view else None,
-                    show=False
+                    show=False,
+                    _lines=wireframe_lines,
                 )
 
                 p.set_preset_3d_view_angle(preset_view)
@@ -660,6 +706,88 @@ class Airplane(AeroSandboxObject):
 
         return aerodynamic_center
 
+    def generate_polars(self,
+                        cache_dir: Union[str, "Path"] = None,
+                        **kwargs
+                        ) -> None:
+        """
+        Generates polar surrogate models for every unique airfoil used by this airplane's wings, in-place.
+
+        Equivalent to calling `Airfoil.generate_polars()` on each airfoil yourself, except that:
+
+            * Airfoils are deduplicated (by object identity), so cross-sections that share an Airfoil object only
+              generate its polars once.
+
+            * Distinct airfoils are swept concurrently. Since XFoil runs as an external subprocess, a thread pool is
+              sufficient to overlap the sweeps.
+
+        Args:
+
+            cache_dir: A directory in which to store the polar cache files, one per airfoil, named
+                "<airfoil.name>.json". If same-named airfoils with different coordinates are found, their
+                filenames are disambiguated with a short fingerprint of the coordinates. The directory is
+                created if it does not already exist. If this is None (the default), no caching is performed.
+                See the `cache_filename` argument of `Airfoil.generate_polars()`.
+
+            **kwargs: Additional keyword arguments to pass into each `Airfoil.generate_polars()` call.
+
+        Returns: None (in-place)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from pathlib import Path
+        import hashlib
+
+        if cache_dir is not None:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+        ### Gather the unique Airfoil objects, grouped by name. Same-named airfoils are run sequentially within a
+        ### group, so that the first run populates the cache file and the rest read from it.
+        airfoil_groups: Dict[str, List] = {}
+        for wing in self.wings:
+            for xsec in wing.xsecs:
+                group = airfoil_groups.setdefault(xsec.airfoil.name, [])
+                if not any(xsec.airfoil is airfoil for airfoil in group):
+                    group.append(xsec.airfoil)
+
+        def generate_polars_for_group(group):
+            # Sharing one cache file within a group is only sound if the group members actually share
+            # geometry. Same-named airfoils with different coordinates are easy to produce (e.g.,
+            # set_TE_thickness() and add_control_surface() both keep the original name), and silently
+            # handing them the first member's polars would be wrong - so on a geometry mismatch, each
+            # member's cache filename is disambiguated with a fingerprint of its coordinates.
+            geometries_match = all(
+                np.array_equal(airfoil.coordinates, group[0].coordinates)
+                for airfoil in group[1:]
+            )
+            if not geometries_match and cache_dir is not None:
+                import warnings
+                warnings.warn(
+                    f"Multiple airfoils named {group[0].name!r} have different coordinates; "
+                    f"caching their polars to separate, fingerprint-suffixed files.",
+                    stacklevel=2,
+                )
+
+            for airfoil in group:
+                if cache_dir is None:
+                    cache_filename = None
+                elif geometries_match:
+                    cache_filename = cache_dir / f"{airfoil.name}.json"
+                else:
+                    fingerprint = hashlib.md5(airfoil.coordinates.tobytes()).hexdigest()[:8]
+                    cache_filename = cache_dir / f"{airfoil.name}-{fingerprint}.json"
+
+                airfoil.generate_polars(
+                    cache_filename=cache_filename,
+                    **kwargs
+                )
+
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(
+                generate_polars_for_group,
+                airfoil_groups.values()
+            ))
+
     def with_control_deflections(self,
                                  control_surface_deflection_mappings: Dict[str, float]
                                  ) -> "Airplane":
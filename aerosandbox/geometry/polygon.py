@@ -38,6 +38,24 @@ class Polygon(AeroSandboxObject):
             except AttributeError:
                 return 0
 
+    def _matplotlib_path(self) -> path.Path:
+        """
+        Returns a `matplotlib.path.Path` for this Polygon's coordinates.
+
+        The Path is cached on the instance (validated against the identity of `self.coordinates`),
+        so repeated containment queries - e.g., masking grid points in a flow-field sweep - don't
+        rebuild it each time.
+        """
+        cache = self.__dict__.get("_matplotlib_path_cache")
+        if cache is not None:
+            source_coordinates, cached_path = cache
+            if source_coordinates is self.coordinates:
+                return cached_path
+
+        new_path = path.Path(vertices=self.coordinates)
+        self._matplotlib_path_cache = (self.coordinates, new_path)
+        return new_path
+
     def contains_points(self,
                         x: Union[float, np.ndarray],
                         y: Union[float, np.ndarray],
@@ -55,26 +73,20 @@ class Polygon(AeroSandboxObject):
             inside the Polygon.
 
         """
-        x = np.array(x)
-        y = np.array(y)
         try:
-            input_shape = (x + y).shape
+            x, y = np.broadcast_arrays(x, y)
         except ValueError as e:  # If arrays are not broadcastable
             raise ValueError("Inputs x and y could not be broadcast together!") from e
 
-        x = x.reshape(-1, 1)
-        y = y.reshape(-1, 1)
+        input_shape = x.shape
 
-        points = np.hstack((x, y))
+        points = np.stack((x.reshape(-1), y.reshape(-1)), axis=1)
 
-        contained = path.Path(
-            vertices=self.coordinates
-        ).contains_points(
+        contained = self._matplotlib_path().contains_points(
             points
         )
-        contained = np.array(contained).reshape(input_shape)
 
-        return contained
+        return contained.reshape(input_shape)
 
     def area(self) -> float:
         """
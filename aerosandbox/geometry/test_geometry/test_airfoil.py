@@ -23,7 +23,7 @@ def test_fake_airfoil():
 
 
 def test_TE_angle(naca4412):
-    assert naca4412.TE_angle() == pytest.approx(14.74635802332286, abs=1)
+    assert naca4412.TE_angle() == pytest.approx(15.835130805701464, abs=1)
 
 
 def test_local_thickness(e216):
@@ -98,5 +98,22 @@ def test_optimize_through_control_surface_deflections_for_CL():
     afd.draw()
 
 
+def test_equality_and_hash(naca4412):
+    same = Airfoil("naca4412")
+    assert same == naca4412
+    assert hash(same) == hash(naca4412)
+
+    nearly_same = Airfoil("naca4412", coordinates=naca4412.coordinates + 1e-12)
+    assert nearly_same == naca4412  # Within __eq__'s floating-point tolerance, despite differing bytes.
+    assert hash(nearly_same) == hash(naca4412)  # Equal objects must hash equal...
+    assert nearly_same in {naca4412}  # ...so tolerance-equal airfoils work as set members / dict keys.
+
+    different = Airfoil("naca0012")
+    assert different != naca4412
+    assert naca4412 != "naca4412"
+
+    assert len({naca4412, same, different}) == 2  # The equal pair collapses to one set member.
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -0,0 +1,165 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+from aerosandbox.geometry.airfoil import airfoil as airfoil_module
+
+alphas = np.linspace(-5, 5, 11)
+Res = np.geomspace(1e5, 1e7, 3)
+
+
+def make_fake_xfoil(airfoils_swept: list):
+    """
+    Returns a stand-in for asb.XFoil that produces smooth, plausible polar data without needing an XFoil
+    executable (which may not be available in CI). Every construction appends the analyzed airfoil to
+    `airfoils_swept`, so tests can count how many sweeps actually ran.
+    """
+
+    class FakeXFoil:
+        def __init__(self, airfoil, Re, **kwargs):
+            self.airfoil = airfoil
+            airfoils_swept.append(airfoil)
+
+        def alpha(self, alpha):
+            alpha = np.array(alpha)
+            return {
+                "alpha": alpha,
+                "CL"   : 0.1 * alpha,
+                "CD"   : 0.01 + 1e-4 * alpha ** 2,
+                "CM"   : -0.05 * np.ones_like(alpha),
+            }
+
+    return FakeXFoil
+
+
+def test_npz_cache_round_trip(tmp_path, monkeypatch):
+    airfoils_swept = []
+    monkeypatch.setattr("aerosandbox.aerodynamics.aero_2D.XFoil", make_fake_xfoil(airfoils_swept))
+
+    cache_filename = str(tmp_path / "naca0012.npz")
+
+    ### First run: no cache exists, so the solver sweep runs and writes the cache.
+    af = asb.Airfoil("naca0012")
+    af.generate_polars(alphas=alphas, Res=Res, cache_filename=cache_filename)
+
+    assert len(airfoils_swept) == len(Res)
+    assert af.has_polars()
+    assert (tmp_path / "naca0012.npz").exists()
+    assert not (tmp_path / "naca0012.npz.tmp").exists()  # The temp file was atomically renamed into place.
+
+    ### Second run: clear the in-process parse cache to force an actual read of the .npz file from disk.
+    airfoil_module._polar_cache_file_reads.clear()
+
+    af2 = asb.Airfoil("naca0012")
+    af2.generate_polars(alphas=alphas, Res=Res, cache_filename=cache_filename)
+
+    assert len(airfoils_swept) == len(Res)  # No new sweeps; the cache was used.
+    for k in af.xfoil_data.keys():
+        assert np.all(af2.xfoil_data[k] == af.xfoil_data[k])
+    assert (
+            af2.CL_function(alpha=3, Re=1e6, mach=0) ==
+            pytest.approx(af.CL_function(alpha=3, Re=1e6, mach=0))
+    )
+
+
+def test_cache_file_reads_are_shared_across_airfoils(tmp_path, monkeypatch):
+    airfoils_swept = []
+    monkeypatch.setattr("aerosandbox.aerodynamics.aero_2D.XFoil", make_fake_xfoil(airfoils_swept))
+
+    cache_filename = str(tmp_path / "naca0012.npz")
+
+    af0 = asb.Airfoil("naca0012")
+    af0.generate_polars(alphas=alphas, Res=Res, cache_filename=cache_filename)
+    for v in af0.xfoil_data.values():
+        assert not v.flags.writeable  # Frozen on the generation path too, since the memo shares these arrays.
+
+    airfoil_module._polar_cache_file_reads.clear()
+
+    af1 = asb.Airfoil("naca0012")
+    af1.generate_polars(alphas=alphas, Res=Res, cache_filename=cache_filename)
+    af2 = asb.Airfoil("naca0012")
+    af2.generate_polars(alphas=alphas, Res=Res, cache_filename=cache_filename)
+
+    for k in af1.xfoil_data.keys():
+        assert af2.xfoil_data[k] is af1.xfoil_data[k]  # One parsed copy per process, shared by identity.
+        assert not af1.xfoil_data[k].flags.writeable  # The shared arrays are frozen.
+
+
+def test_airplane_generate_polars(tmp_path, monkeypatch):
+    airfoils_swept = []
+    monkeypatch.setattr("aerosandbox.aerodynamics.aero_2D.XFoil", make_fake_xfoil(airfoils_swept))
+
+    main_airfoil = asb.Airfoil("naca4412")  # Shared by both main-wing cross-sections.
+    tail_airfoil = asb.Airfoil("naca0012")
+
+    airplane = asb.Airplane(
+        name="TestPlane",
+        wings=[
+            asb.Wing(
+                name="Main Wing",
+                symmetric=True,
+                xsecs=[
+                    asb.WingXSec(xyz_le=[0, 0, 0], chord=0.3, airfoil=main_airfoil),
+                    asb.WingXSec(xyz_le=[0, 1, 0], chord=0.2, airfoil=main_airfoil),
+                ]
+            ),
+            asb.Wing(
+                name="Tail",
+                symmetric=True,
+                xsecs=[
+                    asb.WingXSec(xyz_le=[1, 0, 0], chord=0.1, airfoil=tail_airfoil),
+                    asb.WingXSec(xyz_le=[1, 0.3, 0], chord=0.1, airfoil=tail_airfoil),
+                ]
+            ),
+        ]
+    )
+
+    airplane.generate_polars(cache_dir=tmp_path, alphas=alphas, Res=Res)
+
+    assert main_airfoil.has_polars()
+    assert tail_airfoil.has_polars()
+    assert (tmp_path / "naca4412.json").exists()
+    assert (tmp_path / "naca0012.json").exists()
+
+    # Each unique Airfoil object was swept exactly once (at each Re), despite being shared across xsecs.
+    assert len(airfoils_swept) == 2 * len(Res)
+    assert {id(af) for af in airfoils_swept} == {id(main_airfoil), id(tail_airfoil)}
+
+
+def test_airplane_generate_polars_same_name_different_geometry(tmp_path, monkeypatch):
+    airfoils_swept = []
+    monkeypatch.setattr("aerosandbox.aerodynamics.aero_2D.XFoil", make_fake_xfoil(airfoils_swept))
+
+    original = asb.Airfoil("naca0012")
+    thickened = original.set_TE_thickness(0.01)  # Different geometry, same name.
+    assert thickened.name == original.name
+
+    airplane = asb.Airplane(
+        name="TestPlane",
+        wings=[
+            asb.Wing(
+                name="Main Wing",
+                symmetric=True,
+                xsecs=[
+                    asb.WingXSec(xyz_le=[0, 0, 0], chord=0.3, airfoil=original),
+                    asb.WingXSec(xyz_le=[0, 1, 0], chord=0.2, airfoil=thickened),
+                ]
+            ),
+        ]
+    )
+
+    with pytest.warns(UserWarning, match="different coordinates"):
+        airplane.generate_polars(cache_dir=tmp_path, alphas=alphas, Res=Res)
+
+    assert original.has_polars()
+    assert thickened.has_polars()
+
+    # Each airfoil got its own fingerprint-suffixed cache file, and both were actually swept.
+    cache_files = sorted(f.name for f in tmp_path.iterdir())
+    assert len(cache_files) == 2
+    assert all(f.startswith("naca0012-") and f.endswith(".json") for f in cache_files)
+    assert len(airfoils_swept) == 2 * len(Res)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -72,5 +72,32 @@ def test_aerodynamic_center():
     assert ac[2] == pytest.approx(3, abs=2e-2)
 
 
+def test_from_arrays():
+    af = Airfoil("naca0012")
+
+    wing = Wing.from_arrays(
+        xyz_le=[[0, 0, 0], [0.2, 1, 0]],
+        chord=[0.5, 0.3],
+        twist=2,
+        airfoil=af,
+        name="MyWing",
+        symmetric=True,
+    )
+
+    assert len(wing.xsecs) == 2
+    assert wing.name == "MyWing"
+    assert wing.span() == pytest.approx(2, abs=1e-4)
+    assert all(xsec.twist == 2 for xsec in wing.xsecs)  # Scalar twist is broadcast to all cross-sections.
+    assert all(xsec.airfoil is af for xsec in wing.xsecs)  # A single Airfoil is shared, not copied.
+
+
+def test_from_arrays_length_mismatch():
+    with pytest.raises(ValueError):
+        Wing.from_arrays(
+            xyz_le=[[0, 0, 0], [0, 1, 0]],
+            chord=[0.5],
+        )
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -117,6 +117,69 @@ class Wing(AeroSandboxObject):
                 for xsec in self.xsecs
             ]
 
+    @classmethod
+    def from_arrays(cls,
+                    xyz_le: Union[np.ndarray, List[List[float]]],
+                    chord: Union[np.ndarray, List[float]],
+                    twist: Union[np.ndarray, List[float], float] = 0.,
+                    airfoil: Union[Airfoil, List[Airfoil]] = None,
+                    **kwargs,
+                    ) -> "Wing":
+        """
+        Creates a Wing from arrays of cross-sectional properties, as an alternative to writing out the WingXSec
+        list yourself. Handy when the geometry already lives in arrays (e.g., from an optimization
+        parameterization), or when most cross-sections share the same values.
+
+        Args:
+
+            xyz_le: An Nx3 array (or nested list) of the leading-edge coordinates of each cross-section.
+
+            chord: A length-N array of the chord of each cross-section.
+
+            twist: A length-N array of the twist of each cross-section, in degrees. Can also be a single float,
+            which is applied to all cross-sections.
+
+            airfoil: Either a single Airfoil (shared by all cross-sections; this also lets downstream caching
+            deduplicate work) or a list of N Airfoils, one per cross-section.
+
+            **kwargs: Any other keyword arguments are passed through to the Wing constructor (e.g., `name`,
+            `symmetric`).
+
+        Returns: A Wing with N cross-sections.
+        """
+        xyz_le = [np.array(xyz) for xyz in xyz_le]
+        n_xsecs = len(xyz_le)
+
+        try:
+            twist[0]
+        except (TypeError, IndexError):
+            twist = [twist] * n_xsecs
+
+        if airfoil is None or isinstance(airfoil, Airfoil):
+            airfoil = [airfoil] * n_xsecs
+
+        for input_name, input_value in {
+            "chord"  : chord,
+            "twist"  : twist,
+            "airfoil": airfoil,
+        }.items():
+            if len(input_value) != n_xsecs:
+                raise ValueError(
+                    f"`{input_name}` should have the same length as `xyz_le` ({n_xsecs}).")
+
+        return cls(
+            xsecs=[
+                WingXSec(
+                    xyz_le=xyz_le[i],
+                    chord=chord[i],
+                    twist=twist[i],
+                    **({"airfoil": airfoil[i]} if airfoil[i] is not None else {})
+                )
+                for i in range(n_xsecs)
+            ],
+            **kwargs,
+        )
+
     def __repr__(self) -> str:
         n_xsecs = len(self.xsecs)
         symmetry_description = "symmetric" if self.symmetric else "asymmetric"
@@ -469,10 +532,12 @@ class Wing(AeroSandboxObject):
                     return False
                 if not xsec.twist == 0:  # Surface has to be untwisted
                     return False
-                if not xsec.airfoil.CL_function(0, 1e6, 0, 0) == 0:  # Surface has to have a symmetric airfoil.
+                if not np.abs(xsec.airfoil.CL_function(0, 1e6, 0)) < 1e-4:  # Surface has to have a symmetric airfoil.
                     return False
-                if not xsec.airfoil.CM_function(0, 1e6, 0, 0) == 0:  # Surface has to have a symmetric airfoil.
+                if not np.abs(xsec.airfoil.CM_function(0, 1e6, 0)) < 1e-4:  # Surface has to have a symmetric airfoil.
                     return False
+                # Note: the tolerance here accommodates polar functions that were fit to XFoil data (e.g. via
+                # Airfoil.generate_polars()), which are not exactly zero at alpha = 0 even for symmetric airfoils.
 
         return True
 
@@ -923,37 +988,40 @@ class Wing(AeroSandboxObject):
         """
 
         airfoil_nondim_coordinates = np.array([
-            xsec.airfoil
-            .repanel(
+            xsec.airfoil._repaneled_coordinates(  # Cached, so xsecs sharing an Airfoil object repanel it only once.
                 n_points_per_side=chordwise_resolution + 1,
                 spacing_function_per_side=chordwise_spacing_function_per_side,
             )
-            .coordinates
             for xsec in self.xsecs
         ])
 
-        x_nondim = airfoil_nondim_coordinates[:, :, 0].T
-        y_nondim = airfoil_nondim_coordinates[:, :, 1].T
+        x_nondim = airfoil_nondim_coordinates[:, :, 0]
+        y_nondim = airfoil_nondim_coordinates[:, :, 1]
 
-        spanwise_strips = []
-        for x_n, y_n in zip(x_nondim, y_nondim):
-            spanwise_strips.append(
-                np.stack(
-                    self.mesh_line(
-                        x_nondim=x_n,
-                        z_nondim=y_n,
-                        add_camber=False,
-                    ),
-                    axis=0
+        # Compute the local reference frame of each xsec exactly once, then place all chordwise points of that xsec
+        # with a single broadcasted operation. (Going through `Wing.mesh_line` instead would recompute every frame
+        # once per chordwise station.)
+        points_on_xsecs = []
+        for i, xsec in enumerate(self.xsecs):
+            xg_local, yg_local, zg_local = self._compute_frame_of_WingXSec(i)
+            points_on_xsecs.append(
+                np.array(xsec.xyz_le) + xsec.chord * (
+                        np.outer(x_nondim[i, :], xg_local) +
+                        np.outer(y_nondim[i, :], zg_local)
                 )
             )
 
-        points = np.concatenate(spanwise_strips, axis=0)
+        # Reorder to match the documented mesh ordering: chordwise station-major, xsec-minor.
+        points = np.reshape(
+            np.stack(points_on_xsecs, axis=1),
+            (-1, 3)
+        )
+        num_spanwise_strips = x_nondim.shape[1]
 
         faces = []
 
         num_i = (len(self.xsecs) - 1)
-        num_j = len(spanwise_strips) - 1
+        num_j = num_spanwise_strips - 1
 
         def index_of(iloc, jloc):
             return iloc + jloc * (num_i + 1)
@@ -5,9 +5,40 @@ from aerosandbox.numpy.array import array, zeros_like
 from aerosandbox.numpy.conditionals import where
 from aerosandbox.numpy.logicals import all, any, logical_or
 from typing import Tuple
+from functools import lru_cache
 from scipy import interpolate as _interpolate
 
 
+@lru_cache(maxsize=128)
+def _make_casadi_interpolant(
+        method: str,
+        points_bytes: Tuple[bytes],
+        values_bytes: bytes,
+):
+    """
+    Constructs a CasADi interpolant callable for a given gridded dataset, memoizing on the dataset contents.
+
+    Constructing a CasADi interpolant is expensive (for "bspline", it involves solving for the spline coefficients
+    over the whole grid), and interpn() is typically called many times against the same dataset (e.g., airfoil polar
+    lookups). Caching the interpolant by content means that cost is only paid once per dataset.
+
+    Args:
+        method: The CasADi interpolation method, "linear" or "bspline".
+
+        points_bytes: The grid axis coordinates, each as the raw bytes of a float64 1D array.
+
+        values_bytes: The (Fortran-ravelled) grid values, as the raw bytes of a float64 1D array.
+
+    Returns: A cas.interpolant() callable.
+    """
+    return _cas.interpolant(
+        'Interpolator',
+        method,
+        [_onp.frombuffer(axis_bytes) for axis_bytes in points_bytes],
+        _onp.frombuffer(values_bytes)
+    )
+
+
 def interp(x, xp, fp, left=None, right=None, period=None):
     """
     One-dimensional linear interpolation, analogous to numpy.interp().
@@ -266,11 +297,13 @@ def interpn(
 
         ### Do the interpolation
         values_flattened = _onp.ravel(values, order='F')
-        interpolator = _cas.interpolant(
-            'Interpolator',
-            method,
-            points,
-            values_flattened
+        interpolator = _make_casadi_interpolant(
+            method=method,
+            points_bytes=tuple(
+                _onp.ascontiguousarray(axis_values, dtype=float).tobytes()
+                for axis_values in points
+            ),
+            values_bytes=_onp.ascontiguousarray(values_flattened, dtype=float).tobytes()
         )
 
         fi = interpolator(xi.T).T